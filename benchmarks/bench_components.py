@@ -0,0 +1,50 @@
+# Compares deep copying buttons against building them from templates
+#
+# Usage: python benchmarks/bench_components.py [--number N]
+from discord.ext.paginator.button_pag import (
+    DEFAULT_START,
+    DEFAULT_BACK,
+    DEFAULT_STOP,
+    DEFAULT_FORWARD,
+    DEFAULT_END,
+    _get_template
+)
+
+from copy import deepcopy
+import argparse
+import timeit
+import tracemalloc
+
+BUTTONS = (DEFAULT_START, DEFAULT_BACK, DEFAULT_STOP, DEFAULT_FORWARD, DEFAULT_END)
+TEMPLATES = tuple(_get_template(button) for button in BUTTONS)
+
+
+def with_deepcopy():
+    return [deepcopy(button) for button in BUTTONS]
+
+
+def with_templates():
+    return [template.build() for template in TEMPLATES]
+
+
+def allocated(func) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=10_000)
+    args = parser.parse_args()
+
+    for name, func in (('deepcopy', with_deepcopy), ('template', with_templates)):
+        seconds = min(timeit.repeat(func, number=args.number, repeat=5))
+        print('{:<10} {:>8.2f} us/view {:>8} bytes/view'.format(
+            name, seconds / args.number * 1e6, allocated(func)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# Measures the cost of importing discord.ext.paginator, each sample runs in a fresh interpreter
+#
+# Usage:
+#   python benchmarks/bench_import.py
+#   python benchmarks/bench_import.py --max-import-ms 5
+from typing import Any, Dict, List
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# discord itself is imported first, only the extension's own cost is measured
+SAMPLE = '''
+import json, sys, time
+import discord, discord.ext.commands
+
+start = time.perf_counter()
+import discord.ext.paginator
+imported = time.perf_counter()
+loaded = sorted(name for name in sys.modules if name.startswith('discord.ext.paginator.'))
+
+from discord.ext.paginator import ButtonPaginator
+ButtonPaginator(pages=[{'content': 'page'}])
+used = time.perf_counter()
+
+print(json.dumps({
+    'import_us': (imported - start) * 1e6,
+    'first_use_us': (used - imported) * 1e6,
+    'loaded': loaded,
+}))
+'''
+
+
+def sample() -> Dict[str, Any]:
+    output = subprocess.run([sys.executable, '-c', SAMPLE], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Import time benchmark')
+    parser.add_argument('--repeat', type=int, default=20, help='interpreters to sample')
+    parser.add_argument('--max-import-ms', type=float, help='exit with status 1 if the median import time exceeds this')
+    args = parser.parse_args()
+
+    samples: List[Dict[str, Any]] = [sample() for _ in range(args.repeat)]
+    results = {
+        'import_us': statistics.median(s['import_us'] for s in samples),
+        'first_use_us': statistics.median(s['first_use_us'] for s in samples),
+        'loaded_on_import': samples[0]['loaded'],
+    }
+    print(json.dumps(results, indent=2))
+
+    failed = False
+    if results['loaded_on_import']:
+        # Importing the package alone should not load any submodule
+        print('REGRESSION submodules loaded on import: ' + ', '.join(results['loaded_on_import']), file=sys.stderr)
+        failed = True
+    if args.max_import_ms is not None and results['import_us'] > args.max_import_ms * 1000:
+        print(f'REGRESSION import took {results["import_us"] / 1000:.2f}ms', file=sys.stderr)
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+# Offline benchmarks for paginator start up, clicks, memory and concurrent load
+#
+# Usage:
+#   python benchmarks/bench_paginator.py --output results.json
+#   python benchmarks/bench_paginator.py --compare results.json
+from discord.ext.paginator import ButtonPaginator, DropdownPaginator, PageSet
+from discord.ui import Button
+from discord import Embed
+
+from fakes import FakeContext, FakeInteraction, FakeUser
+
+from typing import Any, Callable, Dict, List
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+def make_pages(count: int, *, shared_embed: bool = False) -> List[Dict[str, Any]]:
+    if shared_embed:
+        # Only the content differs between pages, e.g. a counter above a large embed
+        embed = Embed(title='Shared', description='Lorem ipsum dolor sit amet ' * 20)
+        return [{'content': f'Page {i + 1}', 'embeds': [embed]} for i in range(count)]
+
+    return [
+        {
+            'content': f'Page {i + 1}',
+            'embeds': [Embed(title=f'Page {i + 1}', description='Lorem ipsum dolor sit amet ' * 20)],
+        }
+        for i in range(count)
+    ]
+
+
+def make_paginator(
+    pages: List[Dict[str, Any]], *, extras: bool = False, shared_extras: bool = False, **kwds: Any
+) -> ButtonPaginator:
+    if extras:
+        kwds['extras'] = [[Button(label=f'Extra {i}', row=2)] for i in range(len(pages))]
+    elif shared_extras:
+        kwds['extras'] = [Button(label=f'Extra {i}', row=2) for i in range(5)]
+    return ButtonPaginator(pages=pages, allow_fast_traverse=True, **kwds)
+
+
+# Paginator options compared by the click benchmark, keyed by result suffix
+CLICK_CONFIGS: Dict[str, Dict[str, Any]] = {
+    '': {},
+    '_extras': {'extras': True},
+    '_shared_extras': {'shared_extras': True},
+    '_render_cache': {'render_cache': True},
+    '_shared_embed': {'shared_embed': True},
+}
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    samples = sorted(samples)
+    return {
+        'p50_us': samples[len(samples) // 2] * 1e6,
+        'p99_us': samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6,
+        'mean_us': statistics.fmean(samples) * 1e6,
+        'samples': len(samples),
+    }
+
+
+async def bench_start(args: argparse.Namespace) -> Dict[str, Any]:
+    results = {}
+    pages = make_pages(args.pages)
+
+    factories: Dict[str, Callable[[], Any]] = {
+        'button': lambda: make_paginator(pages),
+        'button_extras': lambda: make_paginator(pages, extras=True),
+        'dropdown': lambda: DropdownPaginator(
+            pages=[(f'Page {i}', p) for i, p in enumerate(pages[:25])], placeholder='Select a page'
+        ),
+    }
+    for name, factory in factories.items():
+        samples = []
+        for _ in range(args.iterations):
+            paginator = factory()
+            ctx = FakeContext()
+
+            start = time.perf_counter()
+            await paginator.start(ctx)
+            samples.append(time.perf_counter() - start)
+        results[name] = percentiles(samples)
+    return results
+
+
+async def bench_clicks(args: argparse.Namespace) -> Dict[str, Any]:
+    results = {}
+
+    for suffix, kwds in CLICK_CONFIGS.items():
+        kwds = dict(kwds)
+        pages = make_pages(args.pages, shared_embed=kwds.pop('shared_embed', False))
+        paginator = make_paginator(pages, **kwds)
+        interaction = FakeInteraction()
+        await paginator.start(interaction)
+        view = interaction.message.payload['view']
+
+        for action in ('forward', 'back', 'start', 'end'):
+            callback = getattr(view, '_' + action).callback
+            samples = []
+            sent = []
+            serialized = []
+            for _ in range(args.iterations):
+                click = interaction.click()
+
+                start = time.perf_counter()
+                await callback(click)
+                samples.append(time.perf_counter() - start)
+                sent.extend(click.response.sent_bytes)
+                serialized.extend(click.response.serialize_seconds)
+
+            result = percentiles(samples)
+            result['bytes_per_edit'] = statistics.fmean(sent)
+            result['serialize_per_edit_us'] = statistics.fmean(serialized) * 1e6
+            results[action + suffix] = result
+
+    # Choosing each page in turn from a dropdown
+    pages = make_pages(min(args.pages, 25))
+    paginator = DropdownPaginator(pages=[(f'Page {i}', p) for i, p in enumerate(pages)])
+    interaction = FakeInteraction()
+    await paginator.start(interaction)
+    view = interaction.message.payload['view']
+
+    samples = []
+    for i in range(args.iterations):
+        select = view._select
+        select._values = [str((i + 1) % len(pages))]
+        start = time.perf_counter()
+        await select.callback(interaction.click())
+        samples.append(time.perf_counter() - start)
+    results['select'] = percentiles(samples)
+    return results
+
+
+async def bench_memory(args: argparse.Namespace) -> Dict[str, Any]:
+    results = {}
+    page_set = PageSet(make_pages(args.pages))
+
+    factories: Dict[str, Callable[[], Any]] = {
+        # Every invocation builds its own pages, as was needed before page sets
+        'own_pages': lambda: make_paginator(make_pages(args.pages)),
+        'page_set': lambda: page_set.session(ButtonPaginator, allow_fast_traverse=True),
+    }
+    for name, factory in factories.items():
+        active = []
+
+        gc.collect()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+
+        for _ in range(args.paginators):
+            paginator = factory()
+            interaction = FakeInteraction()
+            await paginator.start(interaction)
+            # The message keeps the view alive, as the client's view store would
+            active.append((paginator, interaction.message))
+
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[name] = {
+            'paginators': len(active),
+            'bytes_per_paginator': (after - before) / len(active),
+        }
+    return results
+
+
+async def bench_concurrent(args: argparse.Namespace) -> Dict[str, Any]:
+    pages = make_pages(args.pages)
+
+    async def user(samples: List[float]) -> None:
+        paginator = make_paginator(pages)
+        interaction = FakeInteraction(user=FakeUser(), delay=args.delay)
+        await paginator.start(interaction)
+        view = interaction.message.payload['view']
+
+        for i in range(args.clicks):
+            callback = (view._forward if i % 3 else view._back).callback
+            start = time.perf_counter()
+            await callback(interaction.click())
+            samples.append(time.perf_counter() - start)
+
+    samples: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(user(samples) for _ in range(args.users)))
+    elapsed = time.perf_counter() - start
+
+    result = percentiles(samples)
+    result.update({
+        'users': args.users,
+        'clicks_per_user': args.clicks,
+        'simulated_delay_s': args.delay,
+        'clicks_per_second': len(samples) / elapsed,
+    })
+    return result
+
+
+BENCHMARKS = {
+    'start': bench_start,
+    'clicks': bench_clicks,
+    'memory': bench_memory,
+    'concurrent': bench_concurrent,
+}
+
+
+def flatten(results: Dict[str, Any], prefix: str = '') -> Dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, prefix + key + '.'))
+        elif isinstance(value, (int, float)):
+            flat[prefix + key] = value
+    return flat
+
+
+def compare(baseline: Dict[str, Any], results: Dict[str, Any], threshold: float) -> bool:
+    """ Prints metrics which regressed by more than ``threshold``, returns whether any did """
+    old = flatten(baseline['results'])
+    new = flatten(results['results'])
+    regressed = False
+
+    for key, value in new.items():
+        # Only latency and size metrics are compared, higher is worse for both
+        if key not in old or not key.endswith(('_us', 'bytes_per_paginator', 'bytes_per_edit')) or not old[key]:
+            continue
+        change = (value - old[key]) / old[key]
+        if change > threshold:
+            regressed = True
+            print(f'REGRESSION {key}: {old[key]:.2f} -> {value:.2f} ({change:+.1%})', file=sys.stderr)
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Offline paginator benchmarks')
+    parser.add_argument('benchmarks', nargs='*', help='benchmarks to run: ' + ', '.join(BENCHMARKS))
+    parser.add_argument('--pages', type=int, default=100)
+    parser.add_argument('--iterations', type=int, default=1000)
+    parser.add_argument('--paginators', type=int, default=1000, help='active paginators for memory benchmark')
+    parser.add_argument('--users', type=int, default=200, help='concurrent users')
+    parser.add_argument('--clicks', type=int, default=20, help='clicks per concurrent user')
+    parser.add_argument('--delay', type=float, default=0.0, help='simulated seconds per request')
+    parser.add_argument('--output', help='file to write JSON results to, defaults to stdout')
+    parser.add_argument('--compare', help='baseline JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative regression')
+    args = parser.parse_args()
+
+    names = args.benchmarks or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error(f'unknown benchmark {name!r}')
+
+    results = {
+        'python': platform.python_version(),
+        'params': {k: v for k, v in vars(args).items() if k not in ('benchmarks', 'output', 'compare')},
+        'results': {name: asyncio.run(BENCHMARKS[name](args)) for name in names},
+    }
+
+    dumped = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as fp:
+            fp.write(dumped)
+    else:
+        print(dumped)
+
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)
+        if compare(baseline, results, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+# Offline stand-ins for discord.py objects used by the benchmarks
+#
+# Responses serialize their payload the same way discord.py does before a request,
+# so serialization cost and payload size are part of every measurement.
+from discord.ext.commands import Context
+
+from typing import Any, Dict, List, Optional
+import asyncio
+import itertools
+import json
+import time
+
+_ids = itertools.count(1)
+
+
+def serialize(**payload: Any) -> bytes:
+    """ Serializes message kwargs into the JSON body discord.py would send """
+    body: Dict[str, Any] = {}
+
+    if 'content' in payload:
+        body['content'] = payload['content']
+    if payload.get('embed') is not None:
+        body['embeds'] = [payload['embed'].to_dict()]
+    if payload.get('embeds') is not None:
+        body['embeds'] = [embed.to_dict() for embed in payload['embeds']]
+    if 'view' in payload:
+        view = payload['view']
+        body['components'] = view.to_components() if view is not None else []
+
+    return json.dumps(body, separators=(',', ':')).encode()
+
+
+class FakeUser:
+    def __init__(self, id: Optional[int] = None) -> None:
+        self.id = id or next(_ids)
+        self.bot = False
+
+
+class FakeMessage:
+    def __init__(self, channel_id: int, **payload: Any) -> None:
+        self.id = next(_ids)
+        self.channel_id = channel_id
+        self.payload = payload
+
+    async def edit(self, **payload: Any) -> 'FakeMessage':
+        serialize(**payload)
+        self.payload.update(payload)
+        return self
+
+
+class FakeResponse:
+    """ Stand in for :class:`discord.InteractionResponse`
+
+    Parameters
+    ----------
+    delay: float
+        Seconds to sleep per request, simulating network latency
+    """
+    def __init__(self, interaction: 'FakeInteraction', delay: float = 0) -> None:
+        self._interaction = interaction
+        self._done = False
+        self.delay = delay
+        self.sent_bytes: List[int] = []
+        self.serialize_seconds: List[float] = []
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def _request(self, payload: Dict[str, Any]) -> None:
+        if self._done:
+            raise RuntimeError('This interaction has already been responded to before')
+        self._done = True
+
+        start = time.perf_counter()
+        body = serialize(**payload)
+        self.serialize_seconds.append(time.perf_counter() - start)
+        self.sent_bytes.append(len(body))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+    async def send_message(self, **payload: Any) -> None:
+        await self._request(payload)
+        self._interaction.message = FakeMessage(self._interaction.channel_id, **payload)
+
+    async def edit_message(self, **payload: Any) -> None:
+        await self._request(payload)
+        if self._interaction.message is not None:
+            self._interaction.message.payload.update(payload)
+
+    async def defer(self, **kwds: Any) -> None:
+        await self._request({})
+
+
+class FakeInteraction:
+    """ Stand in for :class:`discord.Interaction`, a new one is needed for each click """
+    def __init__(
+        self, *,
+        user: Optional[FakeUser] = None,
+        channel_id: int = 1,
+        guild_id: int = 1,
+        message: Optional[FakeMessage] = None,
+        delay: float = 0
+    ) -> None:
+        self.id = next(_ids)
+        self.user = user or FakeUser()
+        self.channel_id = channel_id
+        self.guild_id = guild_id
+        self.message = message
+        self.response = FakeResponse(self, delay=delay)
+
+    def click(self) -> 'FakeInteraction':
+        """ Returns a new interaction for the same user and message """
+        return FakeInteraction(
+            user=self.user, channel_id=self.channel_id, guild_id=self.guild_id,
+            message=self.message, delay=self.response.delay
+        )
+
+    async def original_response(self) -> Optional[FakeMessage]:
+        return self.message
+
+    async def edit_original_response(self, **payload: Any) -> Optional[FakeMessage]:
+        serialize(**payload)
+        if self.message is not None:
+            self.message.payload.update(payload)
+        return self.message
+
+
+class FakeContext(Context):
+    """ Stand in for :class:`discord.ext.commands.Context` """
+    def __init__(self, *, user: Optional[FakeUser] = None, channel_id: int = 1, delay: float = 0) -> None:
+        self.author = user or FakeUser()
+        self.channel_id = channel_id
+        self.delay = delay
+        self.message = None
+
+    async def send(self, **payload: Any) -> FakeMessage:
+        serialize(**payload)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        self.message = FakeMessage(self.channel_id, **payload)
+        return self.message
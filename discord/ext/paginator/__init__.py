@@ -1,14 +1,192 @@
-from .paginator import (
-    DefaultView,
-    PaginatorView,
-    Paginator
-)
-from .button_pag import (
-    ButtonPaginator,
-    ButtonPaginatorView
-)
-from .dropdown_pag import (
-    DropdownPaginator,
-    DropdownPaginatorView,
-    GenPlaceholder
-)
+# Submodules are imported on first use, workers which never paginate skip loading them
+from importlib import import_module
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .paginator import (
+        DefaultView,
+        PaginatorView,
+        Paginator
+    )
+    from .source import (
+        PageSource,
+        ListPageSource,
+        IteratorPageSource,
+        PageSet
+    )
+    from .keyset import (
+        KeysetPageSource,
+        SQLitePageSource
+    )
+    from .text import (
+        TextSplitter,
+        TextPageSource,
+        split_lines,
+        async_split_lines
+    )
+    from .table import (
+        TablePageSource,
+        TablePaginator
+    )
+    from .builder import (
+        PageValidationError,
+        build_pages,
+        validate_pages
+    )
+    from .render import (
+        RenderCache,
+        FrozenEmbed
+    )
+    from .attachments import (
+        PageAttachment
+    )
+    from .components import (
+        ButtonTemplate
+    )
+    from .button_pag import (
+        ButtonPaginator,
+        ButtonPaginatorView,
+        SearchModal,
+        JumpModal
+    )
+    from .dropdown_pag import (
+        DropdownPaginator,
+        DropdownPaginatorView,
+        GenPlaceholder,
+        CachedPlaceholder
+    )
+    from .router import (
+        PaginatorRouter,
+        RoutedButton
+    )
+    from .store import (
+        SessionStore,
+        MemorySessionStore,
+        SQLiteSessionStore
+    )
+    from .scheduler import (
+        EditScheduler,
+        RateBucket
+    )
+    from .timers import (
+        TimerWheel
+    )
+    from .metrics import (
+        Instrumentation,
+        StatsCollector,
+        LoggingInstrumentation,
+        set_instrumentation,
+        get_instrumentation
+    )
+    from .registry import (
+        PaginatorRegistry
+    )
+    from .search import (
+        SearchIndex
+    )
+
+_SUBMODULES = {
+    'paginator': (
+        'DefaultView',
+        'PaginatorView',
+        'Paginator',
+    ),
+    'source': (
+        'PageSource',
+        'ListPageSource',
+        'IteratorPageSource',
+        'PageSet',
+    ),
+    'keyset': (
+        'KeysetPageSource',
+        'SQLitePageSource',
+    ),
+    'text': (
+        'TextSplitter',
+        'TextPageSource',
+        'split_lines',
+        'async_split_lines',
+    ),
+    'table': (
+        'TablePageSource',
+        'TablePaginator',
+    ),
+    'builder': (
+        'PageValidationError',
+        'build_pages',
+        'validate_pages',
+    ),
+    'render': (
+        'RenderCache',
+        'FrozenEmbed',
+    ),
+    'attachments': (
+        'PageAttachment',
+    ),
+    'components': (
+        'ButtonTemplate',
+    ),
+    'button_pag': (
+        'ButtonPaginator',
+        'ButtonPaginatorView',
+        'SearchModal',
+        'JumpModal',
+    ),
+    'dropdown_pag': (
+        'DropdownPaginator',
+        'DropdownPaginatorView',
+        'GenPlaceholder',
+        'CachedPlaceholder',
+    ),
+    'router': (
+        'PaginatorRouter',
+        'RoutedButton',
+    ),
+    'store': (
+        'SessionStore',
+        'MemorySessionStore',
+        'SQLiteSessionStore',
+    ),
+    'scheduler': (
+        'EditScheduler',
+        'RateBucket',
+    ),
+    'timers': (
+        'TimerWheel',
+    ),
+    'metrics': (
+        'Instrumentation',
+        'StatsCollector',
+        'LoggingInstrumentation',
+        'set_instrumentation',
+        'get_instrumentation',
+    ),
+    'registry': (
+        'PaginatorRegistry',
+    ),
+    'search': (
+        'SearchIndex',
+    ),
+}
+
+_LAZY = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+__all__ = tuple(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return import_module('.' + name, __name__)
+
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    value = getattr(import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBMODULES))
@@ -0,0 +1,263 @@
+# Attachment pages, files are loaded once and uploads are reused across visits
+from __future__ import annotations
+from discord import Attachment, Embed, File
+
+from typing import Any, Dict, List, Mapping, Optional, Union
+from urllib.parse import parse_qs, urlsplit
+import io
+import mmap
+import os
+import time
+
+
+class _MemoryReader(io.BufferedIOBase):
+    # Read only stream over shared memory, creating one is free so files rewind without copying
+    def __init__(self, data: memoryview) -> None:
+        super().__init__()
+        self._data = data
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._data)
+        self._position = max(0, offset)
+        return self._position
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        end = len(self._data)
+        if size is not None and size >= 0:
+            end = min(end, self._position + size)
+        chunk = self._data[self._position:end].tobytes()
+        self._position = max(self._position, end)
+        return chunk
+
+    read1 = read
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def _url_expired(url: str) -> bool:
+    # Discord's CDN signs attachment URLs, ``ex`` is their expiry as a hex timestamp
+    expires = parse_qs(urlsplit(url).query).get('ex')
+    if not expires:
+        return False
+    try:
+        return int(expires[0], 16) <= time.time() + 60
+    except ValueError:
+        return False
+
+
+class PageAttachment(object):
+    """ File attached to a page, which can be sent any amount of times
+
+    Files are read the first time they are sent, memory-mapped where possible,
+    and every send reads from the same memory. Once uploaded the paginator keeps the
+    existing attachment when the page is edited again, and when sending new messages
+    (``edit=False``) embeds referencing ``attachment://filename`` use the uploaded URL instead.
+
+    Pages list attachments under the ``attachments`` key.
+
+    .. rubric:: Example
+
+    .. code-block:: py
+
+        from discord.ext.paginator import ButtonPaginator, PageAttachment
+
+        pages = [
+            {
+                'embed': Embed(title=name).set_image(url=f'attachment://{name}'),
+                'attachments': [PageAttachment(f'gallery/{name}')],
+            }
+            for name in os.listdir('gallery')
+        ]
+        await ButtonPaginator(pages=pages).start(ctx)
+
+    Parameters
+    ----------
+    fp: Union[:class:`str`, :class:`os.PathLike`, :class:`bytes`]
+        Path of the file or its contents
+    filename: Optional[:class:`str`]
+        Name of the file, defaults to the name of the path.
+        Required when ``fp`` is bytes.
+    spoiler: :class:`bool`
+        Whether the file is a spoiler
+    description: Optional[:class:`str`]
+        Description of the file
+    """
+    __slots__ = ('fp', 'filename', 'spoiler', 'description', '_data', '_mmap', '_uploaded')
+
+    def __init__(
+        self, fp: Union[str, os.PathLike, bytes], filename: Optional[str] = None, *,
+        spoiler: bool = False,
+        description: Optional[str] = None,
+    ) -> None:
+        if filename is None:
+            if isinstance(fp, (bytes, bytearray, memoryview)):
+                raise ValueError('filename is required for in memory files')
+            filename = os.path.basename(os.fspath(fp))
+
+        self.fp = fp
+        self.filename = filename
+        self.spoiler = spoiler
+        self.description = description
+
+        self._data: Optional[memoryview] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._uploaded: Optional[Attachment] = None
+
+    def __repr__(self) -> str:
+        return f'<PageAttachment filename={self.filename!r}>'
+
+    @property
+    def data(self) -> memoryview:
+        """ Contents of the file, read on first access """
+        if self._data is None:
+            if isinstance(self.fp, (bytes, bytearray, memoryview)):
+                self._data = memoryview(self.fp)
+            else:
+                self._data = self._load(self.fp)
+        return self._data
+
+    @property
+    def size(self) -> int:
+        """ Size of the file in bytes """
+        return len(self.data)
+
+    @property
+    def url(self) -> Optional[str]:
+        """ URL of the uploaded attachment, ``None`` if not uploaded or expired """
+        if self._uploaded is None or _url_expired(self._uploaded.url):
+            return None
+        return self._uploaded.url
+
+    def _load(self, path: Union[str, os.PathLike]) -> memoryview:
+        with open(path, 'rb') as fp:
+            try:
+                self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files and special files cannot be mapped
+                return memoryview(fp.read())
+        return memoryview(self._mmap)
+
+    def to_file(self) -> File:
+        """ Creates a :class:`discord.File` reading from the start of this attachment """
+        return File(
+            _MemoryReader(self.data), filename=self.filename,
+            spoiler=self.spoiler, description=self.description
+        )
+
+    def close(self) -> None:
+        """ Releases the file's memory, it is read again if sent afterwards """
+        if self._data is not None:
+            self._data.release()
+            self._data = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def _embeds(page: Mapping[str, Any]) -> List[Embed]:
+    embeds = list(page.get('embeds') or ())
+    if page.get('embed') is not None:
+        embeds.append(page['embed'])
+    return [embed for embed in embeds if embed is not None]
+
+
+def _referenced(page: Mapping[str, Any]) -> set:
+    # Filenames shown through attachment:// images, only these can be replaced by URLs
+    names = set()
+    for embed in _embeds(page):
+        for url in (embed.image.url, embed.thumbnail.url):
+            if url and url.startswith('attachment://'):
+                names.add(url[13:])
+    return names
+
+
+def _rewrite_embed(embed: Embed, urls: Mapping[str, str]) -> Embed:
+    data = dict(embed.to_dict())
+    changed = False
+    for key in ('image', 'thumbnail'):
+        url = data.get(key, {}).get('url', '')
+        if url.startswith('attachment://') and url[13:] in urls:
+            # Nested dicts are shared with the embed, copy instead of modifying them
+            data[key] = dict(data[key], url=urls[url[13:]])
+            changed = True
+    return Embed.from_dict(data) if changed else embed
+
+
+def match_uploads(
+    sent: Mapping[str, PageAttachment], attachments: List[Attachment], *, keep_urls: bool
+) -> Dict[PageAttachment, Attachment]:
+    """ Matches the attachments of a message to the page attachments last sent to it.
+    ``keep_urls`` should only be set if the message is not edited afterwards,
+    as attachments removed by an edit are deleted along with their URL.
+    """
+    uploads = {}
+    for attachment in attachments:
+        filename = attachment.filename
+        page_attachment = sent.get(filename) or sent.get(filename[8:] if filename.startswith('SPOILER_') else '')
+        if page_attachment is not None and page_attachment._data is not None and attachment.size == page_attachment.size:
+            if keep_urls:
+                page_attachment._uploaded = attachment
+            uploads[page_attachment] = attachment
+    return uploads
+
+
+def prepare_page(page: Dict[str, Any], uploads: Mapping[PageAttachment, Attachment], *, edit: bool) -> Dict[str, PageAttachment]:
+    """ Replaces page attachments in ``page`` with what should be sent,
+    returns the page attachments sent by filename.
+
+    When editing, attachments already on the message are kept as is,
+    otherwise uploaded URLs are used by embeds where possible.
+    """
+    items: List[Union[File, Attachment]] = []
+    sent: Dict[str, PageAttachment] = {}
+    urls: Dict[str, str] = {}
+    referenced = _referenced(page) if not edit else set()
+
+    for attachment in page.pop('attachments', None) or ():
+        if not isinstance(attachment, PageAttachment):
+            items.append(attachment)
+            continue
+
+        if edit:
+            existing = uploads.get(attachment)
+            if existing is not None:
+                items.append(existing)
+                sent[attachment.filename] = attachment
+                continue
+        elif attachment.filename in referenced:
+            url = attachment.url
+            if url is not None:
+                urls[attachment.filename] = url
+                continue
+
+        items.append(attachment.to_file())
+        sent[attachment.filename] = attachment
+
+    if urls:
+        if page.get('embed') is not None:
+            page['embed'] = _rewrite_embed(page['embed'], urls)
+        if page.get('embeds'):
+            page['embeds'] = [_rewrite_embed(embed, urls) for embed in page['embeds']]
+
+    if edit:
+        # Always sent when editing, so attachments of the previous page are removed
+        page['attachments'] = items
+    elif items:
+        page['files'] = items
+    return sent
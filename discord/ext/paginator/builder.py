@@ -0,0 +1,150 @@
+# Building pages in bulk and validating them against Discord's limits
+from __future__ import annotations
+from discord import Embed
+
+from .text import EMBED_DESCRIPTION_LIMIT, MESSAGE_LIMIT
+
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+
+EMBEDS_LIMIT = 10
+EMBED_TOTAL_LIMIT = 6000
+EMBED_TITLE_LIMIT = 256
+EMBED_FIELDS_LIMIT = 25
+EMBED_FIELD_NAME_LIMIT = 256
+EMBED_FIELD_VALUE_LIMIT = 1024
+EMBED_FOOTER_LIMIT = 2048
+EMBED_AUTHOR_LIMIT = 256
+
+
+class PageValidationError(ValueError):
+    """ Raised when pages exceed Discord's limits, lists every violation found
+
+    Attributes
+    ----------
+    errors: List[Tuple[:class:`int`, :class:`str`]]
+        Index of the page and description of each violation
+    """
+    def __init__(self, errors: List[Tuple[int, str]]) -> None:
+        self.errors = errors
+
+        lines = '\n'.join(f'page {index}: {error}' for index, error in errors)
+        super().__init__(f'{len(errors)} page limit violation(s)\n{lines}')
+
+
+def _check(errors: List[str], name: str, value: Any, limit: int) -> None:
+    if value and len(value) > limit:
+        errors.append(f'{name} is {len(value)} characters, limit is {limit}')
+
+
+def page_errors(page: Mapping[str, Any]) -> List[str]:
+    """ Returns every way ``page`` exceeds Discord's limits, empty if it is valid """
+    errors: List[str] = []
+    content = page.get('content')
+    _check(errors, 'content', str(content) if content is not None else None, MESSAGE_LIMIT)
+
+    embeds = list(page.get('embeds') or ())
+    if page.get('embed') is not None:
+        if embeds:
+            errors.append('cannot have both embed and embeds')
+        embeds.append(page['embed'])
+    if len(embeds) > EMBEDS_LIMIT:
+        errors.append(f'has {len(embeds)} embeds, limit is {EMBEDS_LIMIT}')
+
+    total = 0
+    for position, embed in enumerate(embeds):
+        if embed is None:
+            continue
+        name = f'embed {position}'
+
+        # Read the stored values directly, the public proxies are costly to build per page
+        title = embed.title or ''
+        description = embed.description or ''
+        footer = (getattr(embed, '_footer', None) or {}).get('text') or ''
+        author = (getattr(embed, '_author', None) or {}).get('name') or ''
+        fields = getattr(embed, '_fields', None) or []
+        total += len(title) + len(description) + len(footer) + len(author)
+
+        _check(errors, name + ' title', title, EMBED_TITLE_LIMIT)
+        _check(errors, name + ' description', description, EMBED_DESCRIPTION_LIMIT)
+        _check(errors, name + ' footer', footer, EMBED_FOOTER_LIMIT)
+        _check(errors, name + ' author', author, EMBED_AUTHOR_LIMIT)
+
+        if len(fields) > EMBED_FIELDS_LIMIT:
+            errors.append(f'{name} has {len(fields)} fields, limit is {EMBED_FIELDS_LIMIT}')
+        for index, field in enumerate(fields):
+            field_name, value = str(field.get('name') or ''), str(field.get('value') or '')
+            total += len(field_name) + len(value)
+            _check(errors, f'{name} field {index} name', field_name, EMBED_FIELD_NAME_LIMIT)
+            _check(errors, f'{name} field {index} value', value, EMBED_FIELD_VALUE_LIMIT)
+
+    if total > EMBED_TOTAL_LIMIT:
+        errors.append(f'embeds total {total} characters, limit is {EMBED_TOTAL_LIMIT}')
+    return errors
+
+
+def validate_pages(pages: Iterable[Mapping[str, Any]]) -> None:
+    """ Checks every page against Discord's limits
+
+    Raises
+    ------
+    PageValidationError
+        One or more pages exceed a limit, every violation is reported together
+    """
+    errors = [(index, error) for index, page in enumerate(pages) for error in page_errors(page)]
+    if errors:
+        raise PageValidationError(errors)
+
+
+def build_pages(
+    pages: Sequence[Mapping[str, Any]] = (),
+    embeds: Sequence[Union[Embed, List[Embed]]] = (),
+    messages: Sequence[str] = (),
+    *,
+    validate: bool = True,
+) -> List[Dict[str, Any]]:
+    """ Merges pages, embeds and messages into a list of pages in a single pass
+
+    Page ``i`` is made of ``pages[i]``, with ``embeds[i]`` added to its embeds
+    and its content replaced by ``messages[i]``. Input pages are copied, not modified.
+
+    Parameters
+    ----------
+    pages: Sequence[Mapping[:class:`str`, Any]]
+        Pages to start from
+    embeds: Sequence[Union[:class:`Embed`, List[:class:`Embed`]]]
+        An embed or list of embeds to add to each page
+    messages: Sequence[:class:`str`]
+        Content of each page
+    validate: :class:`bool`
+        Whether to check pages against Discord's limits while building them
+
+    Raises
+    ------
+    PageValidationError
+        ``validate`` is set and one or more pages exceed a limit
+    """
+    built: List[Dict[str, Any]] = []
+    errors: List[Tuple[int, str]] = []
+
+    for index in range(max(len(pages), len(embeds), len(messages))):
+        page = dict(pages[index]) if index < len(pages) else {}
+
+        if index < len(embeds):
+            extra = embeds[index]
+            merged = list(page.get('embeds') or ())
+            embed = page.pop('embed', None)
+            if embed is not None:
+                merged.append(embed)
+            merged.extend(extra if isinstance(extra, list) else (extra,))
+            page['embeds'] = merged
+
+        if index < len(messages):
+            page['content'] = messages[index]
+
+        if validate:
+            errors.extend((index, error) for error in page_errors(page))
+        built.append(page)
+
+    if errors:
+        raise PageValidationError(errors)
+    return built
@@ -1,12 +1,17 @@
 from __future__ import annotations
 from discord.ext.commands import Context
-from discord.ui import Button, Item
+from discord.ui import Button, Item, Modal, TextInput
 from discord import ButtonStyle, Interaction
 
 from .paginator import Paginator, DefaultView
+from .components import ButtonTemplate
 
-from typing import List, Optional, Union
-from copy import deepcopy
+from typing import Any, Dict, List, Optional, Sequence, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from discord.ui import View
+    from .router import PaginatorRouter
+    from .scheduler import EditScheduler
 
 
 TRAVERSE_START      = "⏪"
@@ -14,12 +19,101 @@ TRAVERSE_BACK       = "◀️"
 TRAVERSE_STOP       = "⏹️"
 TRAVERSE_FORWARD    = "▶️"
 TRAVERSE_END        = "⏩"
-
-DEFAULT_START       = Button(style=ButtonStyle.primary, emoji=TRAVERSE_START, row=1)
-DEFAULT_BACK        = Button(style=ButtonStyle.primary, emoji=TRAVERSE_BACK, row=1)
-DEFAULT_STOP        = Button(style=ButtonStyle.primary, emoji=TRAVERSE_STOP, row=1)
-DEFAULT_FORWARD     = Button(style=ButtonStyle.primary, emoji=TRAVERSE_FORWARD, row=1)
-DEFAULT_END         = Button(style=ButtonStyle.primary, emoji=TRAVERSE_END, row=1)
+TRAVERSE_SEARCH     = "🔍"
+TRAVERSE_JUMP       = "🔢"
+
+# Jump steps shown at most in each direction, fitting a row along with the jump button
+MAX_JUMP_STEPS = 2
+
+# Default buttons are created on first use through __getattr__, keeping imports cheap
+_DEFAULT_BUTTONS = {
+    'DEFAULT_START':    (ButtonStyle.primary, TRAVERSE_START, 1),
+    'DEFAULT_BACK':     (ButtonStyle.primary, TRAVERSE_BACK, 1),
+    'DEFAULT_STOP':     (ButtonStyle.primary, TRAVERSE_STOP, 1),
+    'DEFAULT_FORWARD':  (ButtonStyle.primary, TRAVERSE_FORWARD, 1),
+    'DEFAULT_END':      (ButtonStyle.primary, TRAVERSE_END, 1),
+    'DEFAULT_SEARCH':   (ButtonStyle.secondary, TRAVERSE_SEARCH, 2),
+    'DEFAULT_JUMP':     (ButtonStyle.secondary, TRAVERSE_JUMP, 3),
+}
+
+# Templates for the default buttons, built once and shared by every paginator
+_DEFAULT_TEMPLATES: Dict[int, ButtonTemplate] = {}
+
+
+def __getattr__(name: str) -> Button:
+    try:
+        style, emoji, row = _DEFAULT_BUTTONS[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    button = Button(style=style, emoji=emoji, row=row)
+    _DEFAULT_TEMPLATES[id(button)] = ButtonTemplate(button)
+    globals()[name] = button
+    return button
+
+
+def _get_template(button: Optional[Button], default: Optional[str] = None) -> ButtonTemplate:
+    if button is None:
+        button = globals().get(default) or __getattr__(default)
+
+    template = _DEFAULT_TEMPLATES.get(id(button))
+    if template is not None and template.button is button:
+        return template
+    return ButtonTemplate(button)
+
+
+class SearchModal(Modal, title='Search pages'):
+    """ Modal asking for a search query, moves the paginator to the next matching page """
+    query = TextInput(label='Search for', placeholder='Words to search for', max_length=100)
+
+    def __init__(self, view: ButtonPaginatorView) -> None:
+        super().__init__()
+        self._view = view
+
+    async def on_submit(self, interaction: Interaction) -> None:
+        view = self._view
+        view._paginator._begin_interaction(interaction)
+        page = await view._paginator.traverse_search(self.query.value)
+        if page is None:
+            return await interaction.response.send_message(
+                f'No pages match "{self.query.value}"', ephemeral=True
+            )
+
+        return await view._respond(interaction, page)
+
+
+class JumpModal(Modal, title='Go to page'):
+    """ Modal asking for a page number, moves the paginator directly to that page """
+    page = TextInput(label='Page', max_length=10)
+
+    def __init__(self, view: ButtonPaginatorView) -> None:
+        super().__init__()
+        self._view = view
+
+        max_page = view._paginator.max_page
+        if max_page is not None:
+            self.page.placeholder = f'1 - {max_page + 1}'
+
+    async def on_submit(self, interaction: Interaction) -> None:
+        view = self._view
+        paginator = view._paginator
+        if not paginator._can_traverse:
+            # Ended while the modal was open
+            return await interaction.response.send_message('This paginator has ended', ephemeral=True)
+
+        max_page = await paginator._get_max_page()
+        try:
+            number = int(self.page.value)
+        except ValueError:
+            number = 0
+        if not 1 <= number <= max_page + 1:
+            return await interaction.response.send_message(
+                f'Enter a page number between 1 and {max_page + 1}', ephemeral=True
+            )
+
+        paginator._begin_interaction(interaction)
+        page = await paginator._traverse_to(number - 1)
+        return await view._respond(interaction, page)
 
 
 class ButtonPaginatorView(DefaultView):
@@ -27,62 +121,101 @@ class ButtonPaginatorView(DefaultView):
 
     _start = None
     _end = None
+    _search = None
+    _jump = None
+
+    def _render_key(self):
+        return (self._render_version, tuple(map(id, self._extras)))
 
     def _add_items(self):
         if self._paginator.allow_fast_traverse:
-            _start = deepcopy(self._paginator._start)
-            _start.callback = self.get_traverse_start()
+            _start = self._paginator._start_template.build()
+            _start.callback = self._instrumented('start', self.get_traverse_start())
             self.add_item(_start)
             self._start = _start
 
-        _back = deepcopy(self._paginator._back)
-        _back.callback = self.get_traverse_back()
+        _back = self._paginator._back_template.build()
+        _back.callback = self._instrumented('back', self.get_traverse_back())
         self.add_item(_back)
 
-        _stop = deepcopy(self._paginator._stop)
-        _stop.callback = self.get_traverse_stop()
+        _stop = self._paginator._stop_template.build()
+        _stop.callback = self._instrumented('stop', self.get_traverse_stop())
         self.add_item(_stop)
 
-        _forward = deepcopy(self._paginator._forward)
-        _forward.callback = self.get_traverse_forward()
+        _forward = self._paginator._forward_template.build()
+        _forward.callback = self._instrumented('forward', self.get_traverse_forward())
         self.add_item(_forward)
 
         if self._paginator.allow_fast_traverse:
-            _end = deepcopy(self._paginator._end)
-            _end.callback = self.get_traverse_end()
+            _end = self._paginator._end_template.build()
+            _end.callback = self._instrumented('end', self.get_traverse_end())
             self.add_item(_end)
             self._end = _end
 
+        if self._paginator.searchable:
+            _search = self._paginator._search_template.build()
+            _search.callback = self._instrumented('search', self.get_traverse_search())
+            self.add_item(_search)
+            self._search = _search
+
+        # Backward steps, the jump button, then forward steps, largest steps outermost
+        steps = self._paginator._jump_steps()
+        self._jumps = []
+        for offset in [-step for step in reversed(steps)] + [None] + steps:
+            if offset is None:
+                if self._paginator.jumpable:
+                    _jump = self._paginator._jump_template.build()
+                    _jump.callback = self._instrumented('jump', self.get_traverse_jump())
+                    self.add_item(_jump)
+                    self._jump = _jump
+                continue
+
+            button = Button(style=ButtonStyle.secondary, label=f'{offset:+}', row=3)
+            button.callback = self._instrumented('jump', self.get_traverse_by(offset))
+            self.add_item(button)
+            self._jumps.append(button)
+
         self._back = _back
         self._stop = _stop
         self._forward = _forward
         self._extras = []
 
-    def _update_extras(self):
+    def _update_extras(self) -> bool:
+        """ Updates extra components for the current page, returns whether they changed """
         if self._paginator._per_page:
             try:
                 items = self._paginator.extras[self._paginator.current_page]
-
-                if items == [-1]:
-                    return
             except IndexError:
-                return
-            else:
-                for i in self._extras:
-                    self.remove_item(i)
-                self._extras.clear()
-
-                for item in items:
-                    self.add_item(item)
-                    self._extras.append(item)
+                return False
+            if items == [-1]:
+                return False
         else:
-            for i in self._extras:
-                self.remove_item(i)
-            self._extras.clear()
-
-            for item in self._paginator.extras:
-                self._extras.append(item)
-                self.add_item(item)
+            items = self._paginator.extras
+
+        if len(items) == len(self._extras) and all(a is b for a, b in zip(items, self._extras)):
+            return False
+
+        wanted = set(map(id, items))
+        kept = [item for item in self._extras if id(item) in wanted]
+        if any(a is not b for a, b in zip(kept, items)):
+            # Kept items would end up out of order, add every item again
+            kept = []
+
+        kept_ids = set(map(id, kept))
+        for item in self._extras:
+            if id(item) not in kept_ids:
+                self.remove_item(item)
+        for item in items[len(kept):]:
+            self.add_item(item)
+
+        self._extras = list(items)
+        return True
+
+    async def _respond(self, interaction: Interaction, page: Dict[str, Any]) -> Any:
+        # Edits leave out components unless they changed
+        if self._update_extras() or not self._paginator.edit:
+            page['view'] = self
+        return await self._paginator._reply(interaction, page)
 
     def __init__(self, ctx: Context, paginator: ButtonPaginator, *, timeout: Optional[float] = 180):
         super().__init__(ctx, paginator, timeout=timeout)
@@ -91,41 +224,38 @@ class ButtonPaginatorView(DefaultView):
 
     def get_traverse_start(self):
         async def traverse_start(interaction: Interaction):
-            page = await self._paginator.traverse_start()
-            page['view'] = self
+            if self._paginator.scheduler is not None:
+                return await self._paginator.scheduler.submit(interaction, self, 'start')
 
-            self._update_extras()
-            if self._paginator.edit:
-                return await interaction.response.edit_message(**page)
-            return await interaction.response.send_message(**page)
+            page = await self._paginator.traverse_start()
+            return await self._respond(interaction, page)
         return traverse_start
 
     def get_traverse_end(self):
         async def traverse_end(interaction: Interaction):
-            page = await self._paginator.traverse_end()
-            page['view'] = self
+            if self._paginator.scheduler is not None:
+                return await self._paginator.scheduler.submit(interaction, self, 'end')
 
-            self._update_extras()
-            if self._paginator.edit:
-                return await interaction.response.edit_message(**page)
-            return await interaction.response.send_message(**page)
+            page = await self._paginator.traverse_end()
+            return await self._respond(interaction, page)
         return traverse_end
 
     def get_traverse_back(self):
         async def traverse_back(interaction: Interaction):
-            page = await self._paginator.traverse_back()
-            page['view'] = self
+            if self._paginator.scheduler is not None:
+                return await self._paginator.scheduler.submit(interaction, self, 'back')
 
-            self._update_extras()
-            if self._paginator.edit:
-                return await interaction.response.edit_message(**page)
-            return await interaction.response.send_message(**page)
+            page = await self._paginator.traverse_back()
+            return await self._respond(interaction, page)
         return traverse_back
 
     def get_traverse_stop(self):
         async def traverse_stop(interaction: Interaction):
             self.stop()
             self._paginator._can_traverse = False
+            self._paginator._record_end('stop')
+            if self._paginator.scheduler is not None:
+                self._paginator.scheduler.cancel(self)
 
             if self._paginator.allow_fast_traverse:
                 self._start.disabled = True
@@ -133,19 +263,44 @@ class ButtonPaginatorView(DefaultView):
             self._back.disabled = True
             self._stop.disabled = True
             self._forward.disabled = True
+            if self._search is not None:
+                self._search.disabled = True
+            if self._jump is not None:
+                self._jump.disabled = True
+            for button in self._jumps:
+                button.disabled = True
+            self.invalidate_render()
 
             return await interaction.response.edit_message(view=self)
         return traverse_stop
 
+    def get_traverse_search(self):
+        async def traverse_search(interaction: Interaction):
+            return await interaction.response.send_modal(SearchModal(self))
+        return traverse_search
+
+    def get_traverse_jump(self):
+        async def traverse_jump(interaction: Interaction):
+            return await interaction.response.send_modal(JumpModal(self))
+        return traverse_jump
+
+    def get_traverse_by(self, offset: int):
+        async def traverse_by(interaction: Interaction):
+            if self._paginator.scheduler is not None:
+                action = 'forward' if offset > 0 else 'back'
+                return await self._paginator.scheduler.submit(interaction, self, action, steps=abs(offset))
+
+            page = await self._paginator.traverse_by(offset)
+            return await self._respond(interaction, page)
+        return traverse_by
+
     def get_traverse_forward(self):
         async def traverse_forward(interaction: Interaction):
-            page = await self._paginator.traverse_forward()
-            page['view'] = self
+            if self._paginator.scheduler is not None:
+                return await self._paginator.scheduler.submit(interaction, self, 'forward')
 
-            self._update_extras()
-            if self._paginator.edit:
-                return await interaction.response.edit_message(**page)
-            return await interaction.response.send_message(**page)
+            page = await self._paginator.traverse_forward()
+            return await self._respond(interaction, page)
         return traverse_forward
 
 
@@ -159,33 +314,80 @@ class ButtonPaginator(Paginator):
 
     Parameters
     ----------
-    traverse_start_button: ``Button``
+    traverse_start_button: Optional[``Button``]
         Custom start button, callback will be overwritten
-    traverse_back_button: ``Button``
+    traverse_back_button: Optional[``Button``]
         Custom back button, callback will be overwritten
-    traverse_stop_button: ``Button``
+    traverse_stop_button: Optional[``Button``]
         Custom stop button, callback will be overwritten
-    traverse_forward_button: ``Button``
+    traverse_forward_button: Optional[``Button``]
         Custom forward button, callback will be overwritten
-    traverse_end_button: ``Button``
+    traverse_end_button: Optional[``Button``]
         Custom end button, callback will be overwritten
+    traverse_search_button: Optional[``Button``]
+        Custom search button, callback will be overwritten
+    traverse_jump_button: Optional[``Button``]
+        Custom go to page button, callback will be overwritten
+    searchable: :class:`bool`
+        Whether to add a search button, which opens a modal
+        and moves to the next page matching the query.
+        Not supported with ``router``, raises :exc:`ValueError`.
+    jump_steps: Union[:class:`bool`, Sequence[:class:`int`]]
+        Page counts to add buttons for moving backward and forward by, at most ``2``, e.g. ``(10, 100)``.
+        If ``True`` the steps adapt to the page count, using the two largest powers of ten below it.
+        Not supported with ``router``, raises :exc:`ValueError`.
+    jumpable: :class:`bool`
+        Whether to add a button opening a modal which moves to the page entered,
+        any page is then reachable in a single interaction.
+        Not supported with ``router``, raises :exc:`ValueError`.
     extras: List[Union[List[``Item``], ``Item``]]
         Extra components to add to paginator
+    router: Optional[:class:`PaginatorRouter`]
+        Router to serve clicks through instead of creating a live view,
+        see :class:`PaginatorRouter`
+    scheduler: Optional[:class:`EditScheduler`]
+        Scheduler to coalesce rapid clicks into fewer edits,
+        see :class:`EditScheduler`.
+        Not supported with ``router``, raises :exc:`ValueError`.
     '''
     def __init__(self, *,
-        traverse_start_button: Button = DEFAULT_START,
-        traverse_back_button: Button = DEFAULT_BACK,
-        traverse_stop_button: Button = DEFAULT_STOP,
-        traverse_forward_button: Button = DEFAULT_FORWARD,
-        traverse_end_button: Button = DEFAULT_END,
+        traverse_start_button: Optional[Button] = None,
+        traverse_back_button: Optional[Button] = None,
+        traverse_stop_button: Optional[Button] = None,
+        traverse_forward_button: Optional[Button] = None,
+        traverse_end_button: Optional[Button] = None,
+        traverse_search_button: Optional[Button] = None,
+        traverse_jump_button: Optional[Button] = None,
+        searchable: bool = False,
+        jump_steps: Union[bool, Sequence[int]] = False,
+        jumpable: bool = False,
         extras: List[Union[List[Item], Item]] = [],
+        router: Optional[PaginatorRouter] = None,
+        scheduler: Optional[EditScheduler] = None,
         **paginator_kwds
     ) -> None:
         paginator_kwds['view'] = ButtonPaginatorView
 
         super().__init__(**paginator_kwds)
+        if router is not None and self.timer is not None:
+            raise ValueError('timer cannot be used with router, routed paginators are expired by the router')
+        if router is not None and (searchable or jumpable or jump_steps):
+            raise ValueError('searchable, jumpable and jump_steps cannot be used with router')
+        if router is not None and scheduler is not None:
+            raise ValueError('scheduler cannot be used with router, routed clicks are edited straight away')
 
         self.extras = extras
+        self.router = router
+        self.scheduler = scheduler
+        self.searchable = searchable
+        self.jumpable = jumpable
+        self._per_page = False
+
+        if not isinstance(jump_steps, bool):
+            jump_steps = sorted(set(jump_steps))
+            if len(jump_steps) > MAX_JUMP_STEPS or any(step < 1 for step in jump_steps):
+                raise ValueError(f'jump_steps must be at most {MAX_JUMP_STEPS} positive page counts')
+        self.jump_steps = jump_steps
 
         if extras:
             if isinstance(extras[0], list):
@@ -195,8 +397,50 @@ class ButtonPaginator(Paginator):
                 assert all(isinstance(i, Item) for i in extras), 'Invalid extras provided'
                 self._per_page = False
 
-        self._start = traverse_start_button
-        self._back = traverse_back_button
-        self._stop = traverse_stop_button
-        self._forward = traverse_forward_button
-        self._end = traverse_end_button
+        self._start_template = _get_template(traverse_start_button, 'DEFAULT_START')
+        self._back_template = _get_template(traverse_back_button, 'DEFAULT_BACK')
+        self._stop_template = _get_template(traverse_stop_button, 'DEFAULT_STOP')
+        self._forward_template = _get_template(traverse_forward_button, 'DEFAULT_FORWARD')
+        self._end_template = _get_template(traverse_end_button, 'DEFAULT_END')
+        self._search_template = _get_template(traverse_search_button, 'DEFAULT_SEARCH')
+        self._jump_template = _get_template(traverse_jump_button, 'DEFAULT_JUMP')
+
+        self._start = self._start_template.button
+        self._back = self._back_template.button
+        self._stop = self._stop_template.button
+        self._forward = self._forward_template.button
+        self._end = self._end_template.button
+        self._search = self._search_template.button
+        self._jump = self._jump_template.button
+
+    def _jump_steps(self) -> List[int]:
+        if self.jump_steps is not True:
+            return list(self.jump_steps or ())
+
+        max_page = self.max_page
+        if max_page is None:
+            # Page count not known yet, fall back to fixed steps
+            return [10, 100]
+
+        steps = []
+        step = 10
+        while step <= max_page:
+            steps.append(step)
+            step *= 10
+        return steps[-MAX_JUMP_STEPS:]
+
+    def _create_view(self, ctx: Union[Context, Interaction], *, timeout: Optional[float]) -> View:
+        if self.router is None:
+            return super()._create_view(ctx, timeout=timeout)
+
+        self.timeout = timeout
+        key = self.router.register(self)
+        return self.router.build_view(self, key)
+
+    async def end(self, *, disable_components: bool = False) -> None:
+        if self.router is not None and getattr(self, '_router_key', None) is not None:
+            self.router.evict(self._router_key)
+            if self.router.store is not None:
+                # Otherwise another process or a restart could serve the ended paginator again
+                await self.router.store.delete(self._router_key)
+        return await super().end(disable_components=disable_components)
@@ -0,0 +1,60 @@
+# Component templates, used for cheaply creating per view components
+from __future__ import annotations
+from discord.ui import Button
+
+from typing import Any, Dict, Optional
+from copy import deepcopy
+
+
+class ButtonTemplate(object):
+    """ Snapshot of a button, used to create fresh copies of it for each view
+    without deep copying the original.
+
+    .. note::
+
+        Changes made to the button after the template is created are not reflected.
+        Subclasses of ``Button`` fall back to being deep copied.
+
+    Parameters
+    ----------
+    button: ``Button``
+        Button to create copies of
+    """
+    __slots__ = ('button', '_kwargs')
+
+    def __init__(self, button: Button) -> None:
+        self.button = button
+        self._kwargs: Optional[Dict[str, Any]] = None
+
+        if type(button) is Button:
+            kwargs = {
+                'style': button.style,
+                'label': button.label,
+                'disabled': button.disabled,
+                'url': button.url,
+                'emoji': button.emoji,
+                'row': button.row,
+            }
+            if button._provided_custom_id:
+                kwargs['custom_id'] = button.custom_id
+            if getattr(button, 'sku_id', None) is not None:
+                kwargs['sku_id'] = button.sku_id
+            self._kwargs = kwargs
+
+    def build(self, **overrides: Any) -> Button:
+        """ Creates a new button from the template
+
+        Parameters
+        ----------
+        overrides: Any
+            Keyword arguments to pass to ``Button`` instead of the template values
+        """
+        if self._kwargs is None:
+            button = deepcopy(self.button)
+            for attr, value in overrides.items():
+                setattr(button, attr, value)
+            return button
+
+        if overrides:
+            return Button(**{**self._kwargs, **overrides})
+        return Button(**self._kwargs)
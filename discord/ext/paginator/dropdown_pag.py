@@ -5,7 +5,11 @@ from discord.ui import Select
 
 from .paginator import Paginator, DefaultView
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+
+
+SECTION_PREFIX = 'section:'
+SELECT_OPTIONS_LIMIT = 25
 
 
 class GenPlaceholder(object):
@@ -30,50 +34,82 @@ class GenPlaceholder(object):
             max=paginator.max_page + 1)
 
 
+class CachedPlaceholder(GenPlaceholder):
+    """ Placeholder formatted from a template, each page's placeholder is only formatted once
+
+    .. rubric:: Example
+
+    .. code-block:: py
+
+        from discord.ext.paginator import CachedPlaceholder, DropdownPaginator
+
+        paginator = DropdownPaginator(pages=pages, placeholder=CachedPlaceholder('Chapter {current} of {max}'))
+
+    Parameters
+    ----------
+    template: :class:`str`
+        Format string given ``current`` and ``max``, page numbers starting from ``1``
+    """
+    # Placeholders kept per template, shared instances are used by many paginators
+    max_size = 1024
+
+    def __init__(self, template: str = 'Page {current} out of {max}') -> None:
+        self.template = template
+        self._cache: Dict[Tuple[int, int], str] = {}
+
+    def generate(self, paginator: DropdownPaginator) -> str:
+        key = (paginator.current_page, paginator.max_page)
+        placeholder = self._cache.get(key)
+        if placeholder is None:
+            if len(self._cache) >= self.max_size:
+                self._cache.clear()
+            placeholder = self._cache[key] = self.template.format(current=key[0] + 1, max=key[1] + 1)
+        return placeholder
+
+
+class PagSelect(Select):
+    """ Select moving its paginator to the chosen page, one is reused across pages """
+    view: DropdownPaginatorView
+
+    async def callback(self, interaction: Interaction):
+        view = self.view
+        paginator = view._paginator
+
+        value = self.values[0]
+        if value.startswith(SECTION_PREFIX):
+            index = int(value[len(SECTION_PREFIX):]) * paginator._window_size
+        else:
+            index = int(value)
+        page = await paginator.traverse_to(index)
+
+        view._update_select()
+        page['view'] = view
+        return await paginator._reply(interaction, page)
+
+
 class DropdownPaginatorView(DefaultView):
     _paginator: DropdownPaginator
 
-    def _add_select(self) -> Select:
-        class PagSelect(Select):
-            def __init__(_, placeholder: str):
-                super().__init__(placeholder=placeholder, options=self._options)
-        
-            async def callback(select_self, interaction: Interaction):
-                value = select_self.values[0]
-                page = await self._paginator.traverse_to(int(value))
-
-                self._add_select()
-                page['view'] = self
-                if self._paginator.edit:
-                    return await interaction.response.edit_message(**page)
-                return await interaction.response.send_message(**page)
-        
-        if self._select:
-            self.remove_item(self._select)
+    def _render_key(self):
+        return (self._render_version, self._paginator.current_page)
 
-        if isinstance(self._paginator._placeholder, GenPlaceholder):
-            placeholder = self._paginator._placeholder.generate(self)
-        else:
-            placeholder = self._paginator._placeholder
-        self._select = PagSelect(placeholder)
+    def _placeholder(self) -> str:
+        placeholder = self._paginator._placeholder
+        if isinstance(placeholder, GenPlaceholder):
+            return placeholder.generate(self._paginator)
+        return placeholder
 
-        super().add_item(self._select)
+    def _update_select(self) -> None:
+        # Only the placeholder, the default option and, across windows, the options change between pages
+        self._select.placeholder = self._placeholder()
+        self._select.options = self._paginator._get_options()
 
     def __init__(self, ctx: Context, paginator: DropdownPaginator, *, timeout: Optional[float] = 180):
         super().__init__(ctx, paginator, timeout=timeout)
 
-        self._options: List[SelectOption] = []
-        self._select: Select = None
-
-        for page, title in enumerate(self._paginator._titles):
-            if isinstance(title, str):
-                option = SelectOption(label=title, value=str(page))
-            elif isinstance(title, dict):
-                option = SelectOption(**title)
-            else:
-                raise TypeError(f'Invalid select option for "{title}", value must be str or dict, instead got {title.__class__.__name__}')
-            self._options.append(option)
-        self._add_select()
+        self._select = PagSelect(placeholder=self._placeholder(), options=paginator._get_options())
+        self._select.callback = self._instrumented('select', self._select.callback)
+        self.add_item(self._select)
 
     
 
@@ -88,22 +124,94 @@ class DropdownPaginator(Paginator):
     ----------
     placeholder: Union[:class:`str`, :class:`GenPlaceholder`]
         Placeholder to display,
-        for dynamically generated placeholders use :class:`GenPlaceholder`
+        for dynamically generated placeholders use :class:`GenPlaceholder`.
+        Defaults to a :class:`CachedPlaceholder` showing the page number.
+    windowed: :class:`bool`
+        Whether to only show a window of options around the current page,
+        along with entries for moving to the previous or next section.
+        Always enabled for more than 25 pages, as a select holds at most 25 options.
+    window_size: :class:`int`
+        Amount of pages shown per window, at most ``23``
     """
     def __init__(self, *,
-                 placeholer: Union[str, GenPlaceholder] = GenPlaceholder(),
+                 placeholder: Union[str, GenPlaceholder] = CachedPlaceholder(),
+                 placeholer: Optional[Union[str, GenPlaceholder]] = None,
+                 windowed: bool = False,
+                 window_size: int = 23,
                  **paginator_kwds) -> None:
+        if not 1 <= window_size <= 23:
+            raise ValueError('window_size must be between 1 and 23')
+
         pages = paginator_kwds.pop('pages', [])
         self._titles = []
-        self._placeholder = placeholer
+        # Misspelt name accepted for compatibility
+        self._placeholder = placeholer if placeholer is not None else placeholder
+        self._window_size = window_size
         
         r = []
         for title, page in pages:
             self._titles.append(title)
             r.append(page)
+        self._windowed = windowed or len(r) > SELECT_OPTIONS_LIMIT
 
         paginator_kwds['pages'] = r
         paginator_kwds['allow_fast_traverse'] = True
         paginator_kwds['view'] = DropdownPaginatorView
 
         super().__init__(**paginator_kwds)
+
+        self._options: List[SelectOption] = []
+        for page, title in enumerate(self._titles):
+            if isinstance(title, str):
+                option = SelectOption(label=title, value=str(page))
+            elif isinstance(title, dict):
+                option = SelectOption(**{'value': str(page), **title})
+            else:
+                raise TypeError(f'Invalid select option for "{title}", value must be str or dict, instead got {title.__class__.__name__}')
+            self._options.append(option)
+
+        self._windows: List[List[SelectOption]] = []
+        if self._windowed:
+            self._build_windows()
+
+    def _build_windows(self) -> None:
+        size = self._window_size
+        count = (len(self._options) - 1) // size + 1
+
+        for section in range(count):
+            window = self._options[section * size:(section + 1) * size]
+            if section > 0:
+                start = (section - 1) * size
+                window.insert(0, SelectOption(
+                    label='Previous section',
+                    description=f'Pages {start + 1} - {start + size}',
+                    value=f'{SECTION_PREFIX}{section - 1}',
+                    emoji='\N{UPWARDS BLACK ARROW}'
+                ))
+            if section < count - 1:
+                start = (section + 1) * size
+                window.append(SelectOption(
+                    label='Next section',
+                    description=f'Pages {start + 1} - {min(start + size, len(self._options))}',
+                    value=f'{SECTION_PREFIX}{section + 1}',
+                    emoji='\N{DOWNWARDS BLACK ARROW}'
+                ))
+            self._windows.append(window)
+
+    def _get_options(self) -> List[SelectOption]:
+        current = self.current_page
+        if self._windowed:
+            section = current // self._window_size
+            options = list(self._windows[section])
+            # Windows after the first start with the previous section entry
+            index = current % self._window_size + (section > 0)
+        else:
+            options = list(self._options)
+            index = current
+
+        # Options are shared between views, only a copy of the current page's is marked as default
+        if 0 <= index < len(options):
+            option = options[index].copy()
+            option.default = True
+            options[index] = option
+        return options
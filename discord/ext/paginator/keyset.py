@@ -0,0 +1,251 @@
+# Query backed page sources using keyset pagination
+from __future__ import annotations
+from discord.utils import maybe_coroutine
+
+from .source import PageSource
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+import asyncio
+import sqlite3
+
+
+class KeysetPageSource(PageSource):
+    """ Base class for page sources backed by a query, using keyset pagination
+
+    Rather than ``LIMIT/OFFSET``, pages are fetched using the key of the last row
+    of the previous page, so fetching a deep page costs the same as the first one.
+    The starting key of every page reached is kept, revisiting or going back
+    to any of them takes a single query.
+
+    Subclasses implement :meth:`fetch_rows`, :meth:`count_rows` and :meth:`format_page`,
+    each of which can be a coroutine.
+
+    Parameters
+    ----------
+    per_page: :class:`int`
+        Rows per page, defaults to ``10``
+    cache_size: Optional[:class:`int`]
+        Maximum amount of pages to cache, see :class:`PageSource`
+    """
+    def __init__(self, *, per_page: int = 10, cache_size: Optional[int] = 128) -> None:
+        super().__init__(cache_size=cache_size)
+        self.per_page = per_page
+
+        # Key each page starts after, None for the first page
+        self._keys: List[Any] = [None]
+
+    def fetch_rows(self, after: Any, limit: int) -> List[Any]:
+        """ Returns up to ``limit`` rows ordered by key, starting after ``after``.
+        ``after`` is ``None`` for the first page.
+        """
+        raise NotImplementedError
+
+    def fetch_keys(self, after: Any, limit: int) -> List[Any]:
+        """ Returns up to ``limit`` keys ordered by key, starting after ``after``.
+        Used to skip ahead several pages at once,
+        override to select only the key columns.
+        """
+        return [self.row_key(row) for row in self.fetch_rows(after, limit)]
+
+    def count_rows(self) -> int:
+        """ Returns the total amount of rows """
+        raise NotImplementedError
+
+    def row_key(self, row: Any) -> Any:
+        """ Returns the key of a row, defaults to its first column """
+        return row[0]
+
+    def format_page(self, rows: List[Any], index: int) -> Dict[str, Any]:
+        """ Formats the rows of a page into a page """
+        raise NotImplementedError
+
+    async def count(self) -> int:
+        rows = await maybe_coroutine(self.count_rows)
+        return max(1, (rows - 1) // self.per_page + 1)
+
+    async def _seek(self, index: int) -> None:
+        # Skip ahead from the furthest known page, collecting page boundaries in one query
+        known = len(self._keys) - 1
+        keys = await maybe_coroutine(self.fetch_keys, self._keys[known], (index - known) * self.per_page)
+
+        # Another fetch may have found some of these boundaries while waiting
+        for page, key in enumerate(keys[self.per_page - 1::self.per_page], known + 1):
+            if page == len(self._keys):
+                self._keys.append(key)
+        if len(self._keys) <= index:
+            # Every remaining row was fetched, so the last page is known
+            self._max_page = max(0, known + (len(keys) - 1) // self.per_page)
+            raise IndexError('page index out of range')
+
+    async def fetch_page(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            raise IndexError('page index out of range')
+        if index >= len(self._keys):
+            await self._seek(index)
+
+        rows = await maybe_coroutine(self.fetch_rows, self._keys[index], self.per_page)
+        if not rows and index > 0:
+            # The previous page ended exactly on the last row
+            self._max_page = index - 1
+            raise IndexError('page index out of range')
+
+        if len(rows) < self.per_page:
+            self._max_page = index
+        elif index + 1 == len(self._keys):
+            self._keys.append(self.row_key(rows[-1]))
+
+        return await maybe_coroutine(self.format_page, rows, index)
+
+    async def is_last(self, index: int) -> bool:
+        if self._max_page is not None:
+            return index >= self._max_page
+        try:
+            await self.get_page(index + 1)
+        except IndexError:
+            if self._max_page is None:
+                self._max_page = index
+            return True
+        return False
+
+    def invalidate(self, index: Optional[int] = None) -> None:
+        super().invalidate(index)
+        if index is None:
+            # Rows may have moved between pages
+            del self._keys[1:]
+            self._max_page = None
+
+
+def _quote(identifier: str) -> str:
+    return '"{}"'.format(identifier.replace('"', '""'))
+
+
+def _default_format(rows: List[sqlite3.Row], index: int) -> Dict[str, Any]:
+    return {'content': '\n'.join(' | '.join(map(str, tuple(row))) for row in rows) or 'No results'}
+
+
+class SQLitePageSource(KeysetPageSource):
+    """ Reference :class:`KeysetPageSource` reading from a local SQLite database,
+    queries run on a worker thread so the event loop is not blocked.
+
+    .. rubric:: Example
+
+    .. code-block:: py
+
+        from discord.ext.paginator import ButtonPaginator, SQLitePageSource
+
+        def format_page(rows, index):
+            return {'content': '\\n'.join(f'{row["name"]}: {row["score"]}' for row in rows)}
+
+        source = SQLitePageSource(
+            'bot.db', 'scores',
+            key=('score', 'user_id'),
+            columns=('name', 'score'),
+            where='guild_id = ?', params=(ctx.guild.id,),
+            formatter=format_page
+        )
+        await ButtonPaginator(pages=source).start(ctx)
+
+    Parameters
+    ----------
+    database: Union[:class:`str`, :class:`sqlite3.Connection`]
+        Path of the database, or an open connection created with ``check_same_thread=False``
+    table: :class:`str`
+        Table to read rows from
+    key: Union[:class:`str`, Sequence[:class:`str`]]
+        Column or columns rows are ordered by, must be unique together
+    columns: Sequence[:class:`str`]
+        Additional columns to select
+    where: Optional[:class:`str`]
+        SQL condition to filter rows by, use ``?`` placeholders for values
+    params: Sequence[Any]
+        Values for placeholders in ``where``
+    formatter: Callable[[List[:class:`sqlite3.Row`], :class:`int`], Dict[:class:`str`, Any]]
+        Formats the rows of a page and its index into a page, can be a coroutine
+    per_page: :class:`int`
+        Rows per page, defaults to ``10``
+    cache_size: Optional[:class:`int`]
+        Maximum amount of pages to cache, see :class:`PageSource`
+    """
+    def __init__(
+        self, database: Union[str, sqlite3.Connection], table: str, *,
+        key: Union[str, Sequence[str]] = 'rowid',
+        columns: Sequence[str] = (),
+        where: Optional[str] = None,
+        params: Sequence[Any] = (),
+        formatter: Callable[[List[sqlite3.Row], int], Any] = _default_format,
+        per_page: int = 10,
+        cache_size: Optional[int] = 128,
+    ) -> None:
+        super().__init__(per_page=per_page, cache_size=cache_size)
+
+        self.database = database
+        self.formatter = formatter
+        self.params = tuple(params)
+
+        self._key_columns = (key,) if isinstance(key, str) else tuple(key)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dpy-paginator-sqlite')
+        self._conn: Optional[sqlite3.Connection] = database if isinstance(database, sqlite3.Connection) else None
+
+        keys = ', '.join(map(_quote, self._key_columns))
+        selected = ', '.join(map(_quote, dict.fromkeys(self._key_columns + tuple(columns))))
+        placeholders = ', '.join('?' for _ in self._key_columns)
+        condition = f'({where})' if where else '1'
+
+        source = f'FROM {_quote(table)} WHERE {condition}'
+        after = f'AND ({keys}) > ({placeholders})'
+        order = f'ORDER BY {keys} LIMIT ?'
+
+        self._first_query = f'SELECT {selected} {source} {order}'
+        self._next_query = f'SELECT {selected} {source} {after} {order}'
+        self._first_keys_query = f'SELECT {keys} {source} {order}'
+        self._next_keys_query = f'SELECT {keys} {source} {after} {order}'
+        self._count_query = f'SELECT COUNT(*) {source}'
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.database, check_same_thread=False)
+        return self._conn
+
+    def _execute(self, query: str, params: Sequence[Any], row_factory: Any = None) -> List[Any]:
+        cursor = self._connect().cursor()
+        cursor.row_factory = row_factory
+        return cursor.execute(query, params).fetchall()
+
+    async def _run(self, *args: Any) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._execute, *args)
+
+    def _key_params(self, after: Any) -> tuple:
+        return tuple(after) if len(self._key_columns) > 1 else (after,)
+
+    async def fetch_rows(self, after: Any, limit: int) -> List[sqlite3.Row]:
+        if after is None:
+            return await self._run(self._first_query, self.params + (limit,), sqlite3.Row)
+        return await self._run(self._next_query, self.params + self._key_params(after) + (limit,), sqlite3.Row)
+
+    async def fetch_keys(self, after: Any, limit: int) -> List[Any]:
+        if after is None:
+            rows = await self._run(self._first_keys_query, self.params + (limit,))
+        else:
+            rows = await self._run(self._next_keys_query, self.params + self._key_params(after) + (limit,))
+        return [row if len(self._key_columns) > 1 else row[0] for row in rows]
+
+    async def count_rows(self) -> int:
+        rows = await self._run(self._count_query, self.params)
+        return rows[0][0]
+
+    def row_key(self, row: sqlite3.Row) -> Any:
+        if len(self._key_columns) == 1:
+            return row[self._key_columns[0]]
+        return tuple(row[column] for column in self._key_columns)
+
+    def format_page(self, rows: List[sqlite3.Row], index: int) -> Any:
+        return self.formatter(rows, index)
+
+    async def close(self) -> None:
+        """ Closes the connection if it was opened by this source """
+        if self._conn is not None and not isinstance(self.database, sqlite3.Connection):
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._conn.close)
+            self._conn = None
+        self._executor.shutdown(wait=False)
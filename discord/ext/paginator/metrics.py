@@ -0,0 +1,187 @@
+# Instrumentation hooks for observing paginator hot paths
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Optional, TYPE_CHECKING
+import logging
+
+if TYPE_CHECKING:
+    from .paginator import Paginator
+
+_log = logging.getLogger(__name__)
+
+
+class Instrumentation(object):
+    """ Base class for receiving paginator metrics, every method is a no-op by default.
+
+    Subclass and override the events you need, then pass an instance to a paginator
+    using ``instrumentation=`` or set it globally using :func:`set_instrumentation`.
+    When no instrumentation is set paginators skip timing entirely.
+
+    .. rubric:: Example
+
+    .. code-block:: py
+
+        from discord.ext.paginator import Instrumentation, set_instrumentation
+
+        class PrometheusInstrumentation(Instrumentation):
+            def on_interaction(self, paginator, action, seconds):
+                CLICK_LATENCY.labels(action).observe(seconds)
+
+        set_instrumentation(PrometheusInstrumentation())
+    """
+    def on_interaction(self, paginator: Paginator, action: str, seconds: float) -> None:
+        """ Called after a view callback responded to an interaction
+
+        Parameters
+        ----------
+        paginator: :class:`Paginator`
+            Paginator which handled the interaction
+        action: :class:`str`
+            Action handled, e.g. ``forward`` or ``select``
+        seconds: :class:`float`
+            Time taken from receiving the interaction to responding
+        """
+
+    def on_page_fetch(self, paginator: Paginator, page: int, seconds: float, cached: bool) -> None:
+        """ Called after a page was fetched and rendered
+
+        Parameters
+        ----------
+        paginator: :class:`Paginator`
+            Paginator the page belongs to
+        page: :class:`int`
+            Index of page fetched
+        seconds: :class:`float`
+            Time taken to fetch and render the page
+        cached: :class:`bool`
+            Whether the page was served from a cache
+        """
+
+    def on_start(self, paginator: Paginator) -> None:
+        """ Called when a paginator becomes active """
+
+    def on_end(self, paginator: Paginator, reason: str) -> None:
+        """ Called when an active paginator ends
+
+        Parameters
+        ----------
+        paginator: :class:`Paginator`
+            Paginator which ended
+        reason: :class:`str`
+            ``timeout`` if it timed out, ``stop`` if the stop button was used
+            or ``end`` if :meth:`Paginator.end` was called
+        """
+
+    def on_edit_error(self, paginator: Paginator, action: str, error: Exception) -> None:
+        """ Called when responding to an interaction failed
+
+        Parameters
+        ----------
+        paginator: :class:`Paginator`
+            Paginator which handled the interaction
+        action: :class:`str`
+            Action being handled
+        error: :class:`Exception`
+            Error raised, it is re-raised afterwards
+        """
+
+
+class StatsCollector(Instrumentation):
+    """ Instrumentation which aggregates metrics in memory,
+    use :meth:`snapshot` to export them, e.g. from a periodic task.
+
+    Parameters
+    ----------
+    max_samples: :class:`int`
+        Amount of recent latency samples kept per metric, defaults to ``1024``
+    """
+    def __init__(self, *, max_samples: int = 1024) -> None:
+        self.max_samples = max_samples
+
+        self.active = 0
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.max_samples))
+
+    def on_interaction(self, paginator: Paginator, action: str, seconds: float) -> None:
+        self.counters['interactions.' + action] += 1
+        self.samples['interaction.' + action].append(seconds)
+
+    def on_page_fetch(self, paginator: Paginator, page: int, seconds: float, cached: bool) -> None:
+        self.counters['pages.cached' if cached else 'pages.fetched'] += 1
+        self.samples['page_fetch'].append(seconds)
+
+    def on_start(self, paginator: Paginator) -> None:
+        self.active += 1
+        self.counters['started'] += 1
+
+    def on_end(self, paginator: Paginator, reason: str) -> None:
+        self.active -= 1
+        self.counters['ended.' + reason] += 1
+
+    def on_edit_error(self, paginator: Paginator, action: str, error: Exception) -> None:
+        self.counters['edit_errors.' + type(error).__name__] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """ Returns the current metrics as a dictionary, latencies are in seconds """
+        latencies = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            latencies[name] = {
+                'p50': ordered[len(ordered) // 2],
+                'p99': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+                'max': ordered[-1],
+            }
+
+        return {
+            'active': self.active,
+            'counters': dict(self.counters),
+            'latencies': latencies,
+        }
+
+
+class LoggingInstrumentation(Instrumentation):
+    """ Instrumentation which logs every event at ``DEBUG`` level,
+    and interactions slower than ``slow_threshold`` at ``WARNING`` level.
+
+    Parameters
+    ----------
+    slow_threshold: :class:`float`
+        Seconds after which an interaction is considered slow, defaults to ``2``
+    """
+    def __init__(self, *, slow_threshold: float = 2) -> None:
+        self.slow_threshold = slow_threshold
+
+    def on_interaction(self, paginator: Paginator, action: str, seconds: float) -> None:
+        level = logging.WARNING if seconds >= self.slow_threshold else logging.DEBUG
+        _log.log(level, '%s handled %s in %.2fms', type(paginator).__name__, action, seconds * 1000)
+
+    def on_page_fetch(self, paginator: Paginator, page: int, seconds: float, cached: bool) -> None:
+        _log.debug('%s fetched page %s in %.2fms (cached=%s)', type(paginator).__name__, page, seconds * 1000, cached)
+
+    def on_start(self, paginator: Paginator) -> None:
+        _log.debug('%s started', type(paginator).__name__)
+
+    def on_end(self, paginator: Paginator, reason: str) -> None:
+        _log.debug('%s ended (%s)', type(paginator).__name__, reason)
+
+    def on_edit_error(self, paginator: Paginator, action: str, error: Exception) -> None:
+        _log.warning('%s failed to respond to %s: %r', type(paginator).__name__, action, error)
+
+
+_instrumentation: Optional[Instrumentation] = None
+
+
+def set_instrumentation(instrumentation: Optional[Instrumentation]) -> None:
+    """ Sets the instrumentation used by paginators created afterwards
+    which were not given one explicitly, ``None`` disables it.
+    """
+    global _instrumentation
+    _instrumentation = instrumentation
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    """ Returns the instrumentation set using :func:`set_instrumentation` """
+    return _instrumentation
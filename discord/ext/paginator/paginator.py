@@ -2,15 +2,111 @@
 from __future__ import annotations
 from discord.ext.commands import Context
 from discord.ui import View
-from discord import Embed, Interaction
-
-from typing import Any, List, Dict, Callable, Type, Union, Optional
+from discord import Attachment, Embed, HTTPException, Interaction, Message
+
+from . import metrics
+from .attachments import PageAttachment, match_uploads, prepare_page
+from .builder import build_pages, validate_pages
+from .metrics import Instrumentation
+from .source import PageSource, ListPageSource
+from .text import TextPageSource, iter_lines
+from .render import RenderCache
+from .registry import PaginatorRegistry
+from .search import SearchIndex
+from .timers import TimerWheel
+
+from contextvars import ContextVar
+from typing import Any, AsyncIterable, Coroutine, Hashable, Iterable, List, Dict, Callable, Set, Type, Union, Optional
+import asyncio
+import logging
+import time
+
+_log = logging.getLogger(__name__)
+
+# Interaction being responded to by the current task, pages produced for it may defer it
+_responding: ContextVar[Optional[Interaction]] = ContextVar('responding', default=None)
+
+# Weight of the latest page production time in the latency estimate
+LATENCY_SMOOTHING = 0.3
+
+
+class _SerializedEmbed(object):
+    # Embed serialized while comparing pages, sent without serializing it again
+    __slots__ = ('_payload',)
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self._payload = payload
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._payload
+
+
+def _shown_fields(page: Dict[str, Any]) -> Dict[str, Any]:
+    # Comparable form of the fields of a message which a page sets
+    shown = {}
+    if 'content' in page:
+        content = page['content']
+        shown['content'] = str(content) if content is not None else None
+    if 'embed' in page or 'embeds' in page:
+        embeds = list(page.get('embeds') or ())
+        if page.get('embed') is not None:
+            embeds.append(page['embed'])
+        shown['embeds'] = [embed.to_dict() for embed in embeds]
+    if 'attachments' in page:
+        # Uploaded attachments are kept by id, new files always differ
+        shown['attachments'] = [getattr(item, 'id', item) for item in page['attachments']]
+    elif page.get('files') or page.get('file'):
+        shown['attachments'] = [object()]
+    return shown
 
 
 class PaginatorView(View):
     _paginator: Paginator
 
+    _render_version = 0
+    _rendered = None
+
+    def _render_key(self) -> Hashable:
+        return self._render_version
+
+    def invalidate_render(self) -> None:
+        """ Discards cached components, call after modifying items of this view directly """
+        self._render_version += 1
+        self._rendered = None
+
+    def to_components(self) -> List[Dict[str, Any]]:
+        if self._paginator._render_cache is None:
+            return super().to_components()
+
+        key = self._render_key()
+        if self._rendered is None or self._rendered[0] != key:
+            self._rendered = (key, super().to_components())
+        return self._rendered[1]
+
+    def _instrumented(self, action: str, callback: Callable[[Interaction], Coroutine[Any, Any, Any]]):
+        # Every component callback is wrapped, interaction_check is left free for subclasses to override
+        paginator = self._paginator
+        instrumentation = paginator.instrumentation
+        if instrumentation is None:
+            async def wrapped(interaction: Interaction) -> Any:
+                paginator._begin_interaction(interaction)
+                return await callback(interaction)
+            return wrapped
+
+        async def wrapped(interaction: Interaction) -> Any:
+            paginator._begin_interaction(interaction)
+            start = time.perf_counter()
+            try:
+                return await callback(interaction)
+            except HTTPException as error:
+                instrumentation.on_edit_error(self._paginator, action, error)
+                raise
+            finally:
+                instrumentation.on_interaction(self._paginator, action, time.perf_counter() - start)
+        return wrapped
+
     async def on_timeout(self) -> None:
+        self._paginator._record_end('timeout')
         await self._paginator.on_end()
         self.stop()
 
@@ -34,8 +130,9 @@ class Paginator(object):
         View instance which handles editing messages,
         for built-in paginators such as :class:`ButtonsPaginator`,
         this arg is invalid.
-    pages: List[Dict[:class:`str`, Any]]
-        An array of pages, i.e messages to send as page.
+    pages: Union[List[Dict[:class:`str`, Any]], :class:`PageSource`]
+        An array of pages, i.e messages to send as page,
+        or a :class:`PageSource` producing pages on demand.
         
         .. note::
 
@@ -69,12 +166,37 @@ class Paginator(object):
         Whether only the person who invoked the pagination is only allowed to respond
     edit: :class:`bool`
         Whether to edit existing view message or generate a new one.
+    render_cache: Union[:class:`bool`, :class:`RenderCache`]
+        Whether to cache serialized embeds and components of visited pages,
+        pages which change should be invalidated using :meth:`Paginator.invalidate`.
+    instrumentation: Optional[:class:`Instrumentation`]
+        Receives timing metrics for this paginator,
+        defaults to the one set using :func:`set_instrumentation`
+    registry: Optional[:class:`PaginatorRegistry`]
+        Registry to track this paginator in once started
+    prefetch: :class:`bool`
+        Whether to fetch the pages around the current page in the background after each traversal,
+        so the next click is usually served from the cache.
+        Only useful with a :class:`PageSource` which caches pages.
+    validate: :class:`bool`
+        Whether to check pages against Discord's limits upfront,
+        raising :class:`PageValidationError` listing every violation.
+        Pages from a :class:`PageSource` are not checked.
+    timer: Optional[:class:`TimerWheel`]
+        Shared scheduler to expire this paginator with instead of a timer per view,
+        see :class:`TimerWheel`
+    defer_after: Optional[:class:`float`]
+        Seconds a page may take to produce before the interaction is deferred,
+        the message is then edited once the page is ready.
+        Uncached pages are deferred right away if recent ones took longer than this,
+        cached pages are always sent in a single response.
+        Defaults to ``None``, never deferring.
     """
     ctx: Union[Context, Interaction]
 
     def __init__(
         self, view: Type[DefaultView], *,
-        pages: List[Dict[str, Any]] = [],
+        pages: Union[List[Dict[str, Any]], PageSource] = [],
         embeds: List[Union[Embed, List[Embed]]] = [],
         messages: List[str] = [],
         cyclical: bool = True,
@@ -85,6 +207,13 @@ class Paginator(object):
         timeout: Optional[int] = 180,
         author_only: bool = True,
         edit: bool = True,
+        render_cache: Union[bool, RenderCache] = False,
+        instrumentation: Optional[Instrumentation] = None,
+        registry: Optional[PaginatorRegistry] = None,
+        prefetch: bool = False,
+        validate: bool = True,
+        timer: Optional[TimerWheel] = None,
+        defer_after: Optional[float] = None,
     ) -> None:
         if not issubclass(view, PaginatorView):
             raise ValueError('Invalid view class provided')
@@ -92,7 +221,6 @@ class Paginator(object):
         self.view_cls = view
         self.allow_fast_traverse = allow_fast_traverse
         ## self.original_message = original_message
-        self.pages = pages
         self.current_page = current_page
         self.start_page = start_page
         self.cyclical = cyclical
@@ -101,36 +229,308 @@ class Paginator(object):
         self.author_only = author_only
         self.edit = edit
 
+        self.instrumentation = instrumentation or metrics.get_instrumentation()
+        self.registry = registry
+        self.prefetch = prefetch
+        self.timer = timer
+        self.defer_after = defer_after
+        self.view = None
+        self.message = None
+        self._search_index = None
+        self._prefetching: Set[asyncio.Task] = set()
+        # Page attachments last sent by filename, and those seen uploaded on the message
+        self._sent_attachments: Dict[str, PageAttachment] = {}
+        self._uploads: Dict[PageAttachment, Attachment] = {}
+        # Smoothed time taken to produce uncached pages
+        self._page_latency: Optional[float] = None
+        # Fields last sent to the message, edits leave out those which are unchanged
+        self._shown: Optional[Dict[str, Any]] = None
+
         self._can_traverse = True
+        self._active = False
+        # Set through the max_page property, overrides the source's page count
+        self._max_page: Optional[int] = None
+        if isinstance(render_cache, RenderCache):
+            self._render_cache = render_cache
+        else:
+            self._render_cache = RenderCache() if render_cache else None
+
+        if isinstance(pages, PageSource):
+            if embeds or messages:
+                raise ValueError('embeds and messages cannot be used with a PageSource')
+            self.source = pages
+            self.pages = None
+            if self.current_page < 0 or (self.max_page is not None and self.current_page > self.max_page):
+                self.current_page = self.start_page
+            return
+
+        if embeds or messages:
+            pages = build_pages(pages, embeds, messages, validate=validate)
+        elif validate:
+            validate_pages(pages)
 
-        for i, v in embeds:
-            if i > (len(self.pages) - 1):
-                if not isinstance(v, list):
-                    self.pages.append({'embeds': [v]})
-                else:
-                    self.pages.append({'embeds': v})
-            else:
-                c = self.pages[i].pop('embed', None)
-                if isinstance(v, list):
-                    v.append(c)
-                else:
-                    v = [c, v]
-                if embeds := self.pages.get('embeds', []):
-                    embeds.extend(v)
-                    self.pages[i]['embeds'] = embeds
-                else:
-                    self.pages['embeds'] = v
-
-        for i, v in messages:
-            if i > (len(self.pages) - 1):
-                self.pages.append({'content': v})
-            else:
-                self.pages[i]['content'] = v
+        self.pages = pages
+        self.source = ListPageSource(pages)
 
-        self.max_page = len(self.pages) - 1
         if self.current_page < 0 or self.current_page > self.max_page:
             self.current_page = self.start_page
 
+    @classmethod
+    def from_lines(
+        cls, lines: Union[Iterable[str], AsyncIterable[str]], *,
+        embed: Optional[Embed] = None,
+        prefix: str = '',
+        suffix: str = '',
+        max_size: Optional[int] = None,
+        **paginator_kwds: Any
+    ) -> Paginator:
+        """ Creates a paginator from an iterable or async iterable of lines,
+        lines are split into pages lazily as they are visited.
+
+        .. admonition:: Example
+
+            .. code-block:: py
+
+                def read_lines(path):
+                    # The file stays open until every line has been read
+                    with open(path) as fp:
+                        yield from fp
+
+                paginator = ButtonPaginator.from_lines(read_lines('bot.log'), prefix='```\\n', suffix='\\n```')
+                await paginator.start(ctx)
+
+        Parameters
+        ----------
+        lines: Union[Iterable[:class:`str`], AsyncIterable[:class:`str`]]
+            Lines of text to paginate, read as pages are visited
+            so they must stay readable until pagination ends, e.g. files must not be closed before then
+        embed: Optional[:class:`Embed`]
+            Embed to place text in the description of, if not provided text is sent as content
+        prefix: :class:`str`
+            Text to start each page with
+        suffix: :class:`str`
+            Text to end each page with
+        max_size: Optional[:class:`int`]
+            Maximum size of a page, defaults to ``2000`` for content and ``4096`` for embeds
+        paginator_kwds: Any
+            Keyword arguments to pass to the paginator
+        """
+        source = TextPageSource(lines, embed=embed, prefix=prefix, suffix=suffix, max_size=max_size)
+        return cls(pages=source, **paginator_kwds)
+
+    @classmethod
+    def from_text(cls, text: str, **kwds: Any) -> Paginator:
+        """ Creates a paginator from a string,
+        takes the same keyword arguments as :meth:`Paginator.from_lines`
+        """
+        return cls.from_lines(iter_lines(text), **kwds)
+
+    @property
+    def max_page(self) -> Optional[int]:
+        """ Index of the last page, ``None`` if the source has not computed it yet.
+
+        Can be set to stop at an earlier page than the source's last one,
+        setting it to ``None`` restores the source's value.
+        """
+        if self._max_page is not None:
+            return self._max_page
+        return self.source.max_page
+
+    @max_page.setter
+    def max_page(self, value: Optional[int]) -> None:
+        self._max_page = value
+
+    async def _get_max_page(self) -> int:
+        if self._max_page is not None:
+            return self._max_page
+        return await self.source.get_max_page()
+
+    async def _is_last(self, index: int) -> bool:
+        if self._max_page is not None:
+            return index >= self._max_page
+        return await self.source.is_last(index)
+
+    async def get_page(self, page: int) -> Dict[str, Any]:
+        """ Fetches a page from :attr:`source`,
+        returns a shallow copy so the stored page is never modified.
+
+        Parameters
+        ----------
+        page: :class:`int`
+            Index of page to fetch
+        """
+        if self.registry is not None:
+            self.registry.touch(self)
+        interaction = _responding.get() if self.defer_after is not None else None
+
+        if self.instrumentation is None and interaction is None:
+            result = await self._get_page(page)
+        else:
+            start = time.perf_counter()
+            cached = self._is_cached(page)
+            if interaction is None or cached:
+                result = await self._get_page(page)
+            else:
+                result = await self._get_page_deferring(page, interaction)
+
+            elapsed = time.perf_counter() - start
+            if not cached:
+                self._record_latency(elapsed)
+            if self.instrumentation is not None:
+                self.instrumentation.on_page_fetch(self, page, elapsed, cached)
+
+        if 'attachments' in result or self._sent_attachments:
+            self._sent_attachments = prepare_page(result, self._uploads, edit=self.edit)
+        if self.prefetch and self.source.cache_size != 0:
+            self._schedule_prefetch()
+        return result
+
+    async def _get_page(self, page: int) -> Dict[str, Any]:
+        if self._render_cache is None:
+            return dict(await self.source.get_page(page))
+
+        rendered = self._render_cache.get(page)
+        if rendered is None:
+            rendered = self._render_cache.render(page, await self.source.get_page(page))
+        return dict(rendered)
+
+    def _is_cached(self, page: int) -> bool:
+        return self.source.is_cached(page) or (self._render_cache is not None and page in self._render_cache)
+
+    def _record_latency(self, elapsed: float) -> None:
+        if self._page_latency is None:
+            self._page_latency = elapsed
+        else:
+            self._page_latency += LATENCY_SMOOTHING * (elapsed - self._page_latency)
+
+    def _begin_interaction(self, interaction: Interaction) -> None:
+        # Called before handling each interaction with the paginator's components or modals
+        self._observe(interaction.message)
+        if self.defer_after is not None:
+            # Lets pages produced while handling this interaction defer it
+            _responding.set(interaction)
+        if self.timer is not None:
+            self.timer.refresh(self)
+
+    async def _get_page_deferring(self, page: int, interaction: Interaction) -> Dict[str, Any]:
+        if interaction.response.is_done():
+            return await self._get_page(page)
+        if self._page_latency is not None and self._page_latency >= self.defer_after:
+            # Predicted to be slow, acknowledge first so the interaction cannot expire
+            await interaction.response.defer()
+            return await self._get_page(page)
+
+        task = asyncio.ensure_future(self._get_page(page))
+        done, _ = await asyncio.wait((task,), timeout=self.defer_after)
+        if not done:
+            await interaction.response.defer()
+        return await task
+
+    def _delta(self, page: Dict[str, Any]) -> Dict[str, Any]:
+        """ Removes fields from ``page`` which the message already shows,
+        returns what the message shows once edited.
+        """
+        fields = _shown_fields(page)
+        if self._shown is None:
+            return fields
+
+        shown = dict(self._shown)
+        for key, value in fields.items():
+            if key in shown and shown[key] == value:
+                if key == 'embeds':
+                    page.pop('embed', None)
+                page.pop(key, None)
+            else:
+                shown[key] = value
+                if key == 'embeds':
+                    page.pop('embed', None)
+                    page['embeds'] = [_SerializedEmbed(payload) for payload in value]
+        return shown
+
+    async def _reply(self, interaction: Interaction, page: Dict[str, Any]) -> Any:
+        if not self.edit:
+            if interaction.response.is_done():
+                return await interaction.followup.send(**page)
+            return await interaction.response.send_message(**page)
+
+        shown = self._delta(page)
+        if not interaction.response.is_done():
+            result = await interaction.response.edit_message(**page)
+        elif page:
+            # Deferred interactions are finished by editing the original response
+            result = await interaction.edit_original_response(**page)
+        else:
+            # Already acknowledged and nothing changed, no request is needed
+            result = None
+        self._shown = shown
+        return result
+
+    def _observe(self, message: Optional[Message]) -> None:
+        # Learn which page attachments were uploaded to the message, so they are not uploaded again
+        if self._sent_attachments and message is not None:
+            self._uploads = match_uploads(self._sent_attachments, message.attachments, keep_urls=not self.edit)
+
+    def _prefetch_targets(self) -> Set[int]:
+        current = self.current_page
+        max_page = self.max_page
+        targets = {current - 1, current + 1}
+        if self.allow_fast_traverse:
+            targets.add(self.start_page)
+        if max_page is not None and (self.allow_fast_traverse or (self.cyclical and current == 0)):
+            targets.add(max_page)
+        if self.cyclical and current == max_page:
+            targets.add(0)
+
+        return {
+            page for page in targets
+            if page >= 0 and page != current and (max_page is None or page <= max_page)
+            and not self.source.is_cached(page)
+        }
+
+    def _schedule_prefetch(self) -> None:
+        if not self._can_traverse:
+            return
+        for page in self._prefetch_targets():
+            task = asyncio.create_task(self._prefetch_page(page))
+            self._prefetching.add(task)
+            task.add_done_callback(self._prefetching.discard)
+
+    async def _prefetch_page(self, page: int) -> None:
+        try:
+            await self._get_page(page)
+        except IndexError:
+            pass
+        except Exception as error:
+            # The page is fetched again, raising normally, if it is visited
+            _log.debug('Prefetching page %s failed: %r', page, error)
+
+    def _record_end(self, reason: str) -> None:
+        for task in self._prefetching:
+            task.cancel()
+        if self.timer is not None:
+            self.timer.cancel(self)
+        if self._active:
+            self._active = False
+            if self.registry is not None:
+                self.registry.unregister(self)
+            if self.instrumentation is not None:
+                self.instrumentation.on_end(self, reason)
+
+    def invalidate(self, page: Optional[int] = None) -> None:
+        """ Discards cached copies of a page, or of every page if no index is provided.
+        The page is fetched from the source and rendered again on its next visit.
+
+        Parameters
+        ----------
+        page: Optional[:class:`int`]
+            Index of page to invalidate
+        """
+        self.source.invalidate(page)
+        if self._render_cache is not None:
+            self._render_cache.invalidate(page)
+        if self._search_index is not None:
+            self._search_index.invalidate()
+
     async def on_traverse_forward(self):
         """ An event called right before forward traversed page is returned """
 
@@ -157,15 +557,16 @@ class Paginator(object):
         if not self._can_traverse:
             raise ValueError('Pagination ended')
 
-        if (self.current_page >= self.max_page and not self.cyclical):
-            return self.pages[self.current_page]
-        elif self.current_page >= self.max_page:
+        last = await self._is_last(self.current_page)
+        if (last and not self.cyclical):
+            return await self.get_page(self.current_page)
+        elif last:
             self.current_page = 0
         else:
             self.current_page += 1
 
         await self.on_traverse_forward()
-        return self.pages[self.current_page]
+        return await self.get_page(self.current_page)
 
     async def traverse_back(self) -> Dict[str, Any]:
         """ Moves backward, i.e previous page """
@@ -173,36 +574,71 @@ class Paginator(object):
             raise ValueError('Pagination ended')
 
         if (self.current_page <= 0 and not self.cyclical):
-            return self.pages[self.current_page]
+            return await self.get_page(self.current_page)
         elif self.current_page <= 0:
-            self.current_page = self.max_page
+            self.current_page = await self._get_max_page()
         else:
             self.current_page -= 1
         
         await self.on_traverse_back()
-        return self.pages[self.current_page]
+        return await self.get_page(self.current_page)
 
     async def traverse_start(self) -> Dict[str, Any]:
         """ Moves to the start, Paginator.start_page """
         if not self._can_traverse:
             raise ValueError('Pagination ended')
         if not self.allow_fast_traverse:
-            return self.pages[self.current_page]
+            return await self.get_page(self.current_page)
         self.current_page = self.start_page
 
         await self.on_traverse_start()
-        return self.pages[self.current_page]
+        return await self.get_page(self.current_page)
 
     async def traverse_end(self) -> Dict[str, Any]:
         """ Moves to the end, Paginator.max_page """
         if not self._can_traverse:
             raise ValueError('Pagination ended')
         if not self.allow_fast_traverse:
-            return self.pages[self.current_page]
-        self.current_page = self.max_page
+            return await self.get_page(self.current_page)
+        self.current_page = await self._get_max_page()
 
         await self.on_traverse_end()
-        return self.pages[self.current_page]
+        return await self.get_page(self.current_page)
+
+    async def traverse_by(self, offset: int) -> Dict[str, Any]:
+        """ Moves by a number of pages, negative offsets move backward.
+        Wraps around if :attr:`cyclical` otherwise stops at the first or last page.
+
+        Calls :meth:`on_traverse_forward` or :meth:`on_traverse_back` once, depending on direction.
+
+        Parameters
+        ----------
+        offset: :class:`int`
+            Amount of pages to move by
+        """
+        if not self._can_traverse:
+            raise ValueError('Pagination ended')
+        if not offset:
+            return await self.get_page(self.current_page)
+
+        if self.max_page is None and offset > 0 and not self.cyclical:
+            # Avoid computing the page count for lazy sources, checking only whether the target page exists
+            target = self.current_page + offset
+            if await self._is_last(target - 1):
+                target = min(target, await self._get_max_page())
+            self.current_page = target
+        else:
+            count = await self._get_max_page() + 1
+            if self.cyclical:
+                self.current_page = (self.current_page + offset) % count
+            else:
+                self.current_page = max(0, min(count - 1, self.current_page + offset))
+
+        if offset > 0:
+            await self.on_traverse_forward()
+        else:
+            await self.on_traverse_back()
+        return await self.get_page(self.current_page)
 
     async def traverse_to(self, page: int) -> Dict[str, Any]:
         """ Moves to a specific page
@@ -215,23 +651,110 @@ class Paginator(object):
         if not self._can_traverse:
             raise ValueError('Pagination ended')
         if not self.allow_fast_traverse:
-            return self.pages[self.current_page]
-        if page < 0 or page > self.max_page:
-            return self.pages[self.current_page]
+            return await self.get_page(self.current_page)
+        return await self._traverse_to(page)
+
+    async def _traverse_to(self, page: int) -> Dict[str, Any]:
+        if page < 0 or page > await self._get_max_page():
+            return await self.get_page(self.current_page)
         self.current_page = page
 
         await self.on_traverse_to()
-        return self.pages[self.current_page]
+        return await self.get_page(self.current_page)
+
+    async def search(self, query: str, *, start: Optional[int] = None) -> Optional[int]:
+        """ Finds the next page containing every word in ``query``,
+        searching page content and embed text. Returns ``None`` if no page matches.
+
+        The search index is built lazily and incrementally on first use.
 
-    async def end(self) -> None:
-        """ Ends pagination """
+        Parameters
+        ----------
+        query: :class:`str`
+            Words to search for
+        start: Optional[:class:`int`]
+            Index of page to start searching from, defaults to the page after the current one.
+            Wraps around to the first page if nothing matches after it.
+        """
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.source)
+        if start is None:
+            start = self.current_page + 1
+        return await self._search_index.search(query, start=start)
+
+    async def traverse_search(self, query: str) -> Optional[Dict[str, Any]]:
+        """ Moves to the next page matching ``query``, see :meth:`Paginator.search`.
+        Returns ``None`` without moving if no page matches.
+
+        Unlike :meth:`Paginator.traverse_to` this is allowed without ``allow_fast_traverse``.
+
+        Parameters
+        ----------
+        query: :class:`str`
+            Words to search for
+        """
+        if not self._can_traverse:
+            raise ValueError('Pagination ended')
+
+        page = await self.search(query)
+        if page is None:
+            return None
+        return await self._traverse_to(page)
+
+    async def end(self, *, disable_components: bool = False) -> None:
+        """ Ends pagination
+
+        Parameters
+        ----------
+        disable_components: :class:`bool`
+            Whether to disable the components on the paginator's message
+        """
         if not self._can_traverse:
             raise ValueError('Pagination already ended')
         self._can_traverse = False
+        self._record_end('end')
+
+        view = self.view
+        if view is not None:
+            view.stop()
+            if disable_components:
+                await self._disable_components(view)
 
         await self.on_end()
         self.ctx = None
 
+    async def _expire(self, *, disable_components: bool) -> None:
+        # Called by the timer wheel, the equivalent of the view timing out
+        if not self._can_traverse:
+            return
+        self._can_traverse = False
+        self._record_end('timeout')
+
+        view = self.view
+        if view is not None:
+            view.stop()
+            if disable_components:
+                await self._disable_components(view)
+
+        await self.on_end()
+
+    async def _disable_components(self, view: View) -> None:
+        for item in view.children:
+            # Dynamic items wrap the actual component
+            item = getattr(item, 'item', item)
+            if hasattr(item, 'disabled'):
+                item.disabled = True
+        if isinstance(view, PaginatorView):
+            view.invalidate_render()
+
+        if self.message is not None:
+            await self.message.edit(view=view)
+        elif isinstance(self.ctx, Interaction):
+            await self.ctx.edit_original_response(view=view)
+
+    def _create_view(self, ctx: Union[Context, Interaction], *, timeout: Optional[float]) -> View:
+        return self.view_cls(ctx, self, timeout=timeout)
+
     async def start(self, ctx: Union[Context, Interaction], *, timeout: int = ..., call: Callable[..., Any] = None) -> None:
         """Starts pagination
 
@@ -254,14 +777,38 @@ class Paginator(object):
 
         self._can_traverse = True
         self.ctx = ctx
+        if not self._active:
+            self._active = True
+            if self.instrumentation is not None:
+                self.instrumentation.on_start(self)
         if isinstance(ctx, Context):
             func = call or ctx.send
         else:
             func = call or ctx.response.send_message
 
-        view = self.view_cls(ctx, self, timeout=timeout if timeout != ... else self.timeout)
-        page = self.pages[self.current_page]
+        if self.registry is not None:
+            self.registry.register(self)
+
+        timeout = timeout if timeout != ... else self.timeout
+        # Views expired by the timer wheel have no timer of their own
+        view = self._create_view(ctx, timeout=timeout if self.timer is None else None)
+        self._sent_attachments = {}
+        self._uploads = {}
+        self._shown = None
+        page = await self.get_page(self.current_page)
         page['view'] = view
+        if 'attachments' in page:
+            # A new message is sent, attachments are uploaded as files
+            files = page.pop('attachments')
+            if files:
+                page['files'] = files
+        self.view = view
 
         await self.on_start()
-        await func(**page)
+        message = await func(**page)
+        self._shown = _shown_fields(page) if self.edit else None
+        self.message = message if isinstance(message, Message) else None
+        self._observe(self.message)
+
+        if self.timer is not None and timeout is not None:
+            self.timer.schedule(self, timeout)
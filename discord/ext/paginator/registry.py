@@ -0,0 +1,189 @@
+# Registry of active paginators, enforces limits and supports bulk shutdown
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
+import asyncio
+import logging
+
+if TYPE_CHECKING:
+    from .paginator import Paginator
+
+_log = logging.getLogger(__name__)
+
+
+def _owner_ids(paginator: Paginator) -> tuple:
+    ctx = paginator.ctx
+    user = getattr(ctx, 'author', None) or getattr(ctx, 'user', None)
+    guild_id = getattr(ctx, 'guild_id', None)
+    if guild_id is None:
+        guild = getattr(ctx, 'guild', None)
+        guild_id = guild.id if guild is not None else None
+    return (user.id if user is not None else None, guild_id)
+
+
+class PaginatorRegistry(object):
+    """ Tracks active paginators, enforcing limits on how many can be active at once
+
+    Once a limit is reached the least recently used paginator is ended
+    using :meth:`Paginator.end` with its components disabled.
+
+    .. rubric:: Example
+
+    .. code-block:: py
+
+        from discord.ext.paginator import ButtonPaginator, PaginatorRegistry
+
+        registry = PaginatorRegistry(max_per_user=3, max_total=10_000)
+
+        ## In commands
+        paginator = ButtonPaginator(pages=pages, registry=registry)
+
+        ## During shutdown
+        await registry.close_all()
+
+    Parameters
+    ----------
+    max_per_user: Optional[:class:`int`]
+        Maximum active paginators per user
+    max_per_guild: Optional[:class:`int`]
+        Maximum active paginators per guild
+    max_total: Optional[:class:`int`]
+        Maximum active paginators overall
+    concurrency: :class:`int`
+        Maximum amount of messages edited at once when ending paginators, defaults to ``10``
+    """
+    def __init__(
+        self, *,
+        max_per_user: Optional[int] = None,
+        max_per_guild: Optional[int] = None,
+        max_total: Optional[int] = None,
+        concurrency: int = 10,
+    ) -> None:
+        self.max_per_user = max_per_user
+        self.max_per_guild = max_per_guild
+        self.max_total = max_total
+        self.concurrency = concurrency
+
+        # Ordered least to most recently used
+        self._active: OrderedDict[Paginator, tuple] = OrderedDict()
+        self._users: Dict[Any, OrderedDict[Paginator, None]] = {}
+        self._guilds: Dict[Any, OrderedDict[Paginator, None]] = {}
+        # Evictions in progress, referenced so they are not garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def __contains__(self, paginator: Paginator) -> bool:
+        return paginator in self._active
+
+    @property
+    def paginators(self) -> List[Paginator]:
+        """ Active paginators, least recently used first """
+        return list(self._active)
+
+    def count_user(self, user_id: int) -> int:
+        """ Amount of active paginators started by a user """
+        return len(self._users.get(user_id, ()))
+
+    def count_guild(self, guild_id: int) -> int:
+        """ Amount of active paginators in a guild """
+        return len(self._guilds.get(guild_id, ()))
+
+    def _select_evictions(self, user_id: Any, guild_id: Any) -> List[Paginator]:
+        evict: Dict[Paginator, None] = {}
+
+        def oldest(group: Optional[OrderedDict], limit: Optional[int]) -> None:
+            if group is None or limit is None:
+                return
+            candidates = [p for p in group if p not in evict]
+            # Leave room for the paginator being registered
+            for paginator in candidates[:max(0, len(candidates) - limit + 1)]:
+                evict[paginator] = None
+
+        oldest(self._users.get(user_id) if user_id is not None else None, self.max_per_user)
+        oldest(self._guilds.get(guild_id) if guild_id is not None else None, self.max_per_guild)
+        oldest(self._active, self.max_total)
+        return list(evict)
+
+    def register(self, paginator: Paginator) -> None:
+        """ Registers a started paginator, ending others if a limit is exceeded.
+
+        Evicted paginators are ended in the background,
+        so starting a paginator never waits on editing older messages.
+        """
+        if paginator in self._active:
+            self.touch(paginator)
+            return
+
+        user_id, guild_id = _owner_ids(paginator)
+        evict = self._select_evictions(user_id, guild_id)
+        for old in evict:
+            self.unregister(old)
+
+        self._active[paginator] = (user_id, guild_id)
+        if user_id is not None:
+            self._users.setdefault(user_id, OrderedDict())[paginator] = None
+        if guild_id is not None:
+            self._guilds.setdefault(guild_id, OrderedDict())[paginator] = None
+
+        if evict:
+            task = asyncio.get_running_loop().create_task(self._end_many(evict))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def touch(self, paginator: Paginator) -> None:
+        """ Marks a paginator as recently used """
+        try:
+            user_id, guild_id = self._active[paginator]
+        except KeyError:
+            return
+
+        self._active.move_to_end(paginator)
+        if user_id is not None:
+            self._users[user_id].move_to_end(paginator)
+        if guild_id is not None:
+            self._guilds[guild_id].move_to_end(paginator)
+
+    def unregister(self, paginator: Paginator) -> None:
+        """ Stops tracking a paginator, called automatically once it ends """
+        try:
+            user_id, guild_id = self._active.pop(paginator)
+        except KeyError:
+            return
+
+        for groups, key in ((self._users, user_id), (self._guilds, guild_id)):
+            if key is None:
+                continue
+            group = groups[key]
+            group.pop(paginator, None)
+            if not group:
+                del groups[key]
+
+    async def _end_many(self, paginators: List[Paginator]) -> int:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def end(paginator: Paginator) -> None:
+            async with semaphore:
+                await paginator.end(disable_components=True)
+
+        results = await asyncio.gather(*map(end, paginators), return_exceptions=True)
+        for paginator, result in zip(paginators, results):
+            if isinstance(result, Exception):
+                _log.warning('Failed to end %r: %r', paginator, result)
+        return sum(1 for result in results if not isinstance(result, Exception))
+
+    async def close_all(self) -> int:
+        """ Ends every active paginator, disabling their components concurrently.
+        Returns the amount of paginators ended cleanly.
+        """
+        paginators = list(self._active)
+        for paginator in paginators:
+            self.unregister(paginator)
+        ended = await self._end_many(paginators)
+
+        # Let evictions still editing their messages finish too
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+        return ended
@@ -0,0 +1,81 @@
+# Render caching, serializes each page's embeds once
+from __future__ import annotations
+from discord import Embed
+
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional
+
+
+class FrozenEmbed(Embed):
+    """ Embed which serializes itself once, :meth:`to_dict` returns the cached payload.
+
+    Modifying a frozen embed does not change what is sent,
+    create a new one using :meth:`FrozenEmbed.freeze` instead.
+    Copies made with :meth:`copy` are not frozen, so they can be modified.
+    """
+    __slots__ = ('_payload',)
+
+    @classmethod
+    def freeze(cls, embed: Embed) -> FrozenEmbed:
+        """ Creates a frozen copy of ``embed`` """
+        if isinstance(embed, FrozenEmbed):
+            return embed
+
+        payload = embed.to_dict()
+        frozen = cls.from_dict(payload)
+        frozen._payload = payload
+        return frozen
+
+    def to_dict(self) -> Dict[str, Any]:
+        try:
+            return self._payload
+        except AttributeError:
+            # Built without freeze, e.g. by copy or from_dict
+            return super().to_dict()
+
+
+class RenderCache(object):
+    """ Caches rendered pages, keyed by page index
+
+    Rendered pages hold :class:`FrozenEmbed` copies of their embeds
+    so repeated visits skip serializing them again.
+
+    Parameters
+    ----------
+    max_size: Optional[:class:`int`]
+        Maximum amount of rendered pages to keep, ``None`` for no limit
+    """
+    def __init__(self, max_size: Optional[int] = 256) -> None:
+        self.max_size = max_size
+
+        self._pages: OrderedDict[int, Dict[str, Any]] = OrderedDict()
+
+    def __contains__(self, index: int) -> bool:
+        return index in self._pages
+
+    def get(self, index: int) -> Optional[Dict[str, Any]]:
+        """ Returns the rendered page at ``index`` if cached """
+        page = self._pages.get(index)
+        if page is not None:
+            self._pages.move_to_end(index)
+        return page
+
+    def render(self, index: int, page: Mapping[str, Any]) -> Dict[str, Any]:
+        """ Renders and caches a page """
+        rendered = dict(page)
+        if rendered.get('embed') is not None:
+            rendered['embed'] = FrozenEmbed.freeze(rendered['embed'])
+        if rendered.get('embeds') is not None:
+            rendered['embeds'] = [FrozenEmbed.freeze(embed) for embed in rendered['embeds'] if embed is not None]
+
+        self._pages[index] = rendered
+        if self.max_size is not None and len(self._pages) > self.max_size:
+            self._pages.popitem(last=False)
+        return rendered
+
+    def invalidate(self, index: Optional[int] = None) -> None:
+        """ Removes a rendered page, or every page if no index is provided """
+        if index is None:
+            self._pages.clear()
+        else:
+            self._pages.pop(index, None)
@@ -0,0 +1,357 @@
+# Stateless component routing, serves every paginator from one dynamic item
+from __future__ import annotations
+from discord.ui import Button, DynamicItem, View
+from discord import Client, HTTPException, Interaction
+from discord.utils import maybe_coroutine
+
+from .paginator import Paginator
+from .store import SessionStore
+
+from typing import Any, Callable, Coroutine, Dict, Optional, Set, TYPE_CHECKING
+from functools import wraps
+import asyncio
+import logging
+import os
+import re
+import time
+
+if TYPE_CHECKING:
+    from .button_pag import ButtonPaginator
+
+_log = logging.getLogger(__name__)
+
+ACTIONS = ('start', 'back', 'stop', 'forward', 'end')
+
+
+class RoutedButton(DynamicItem[Button], template=r'(?!)'):
+    """ Button carrying the paginator key and action inside its ``custom_id``,
+    subclassed by every :class:`PaginatorRouter` with its own template.
+    """
+    router: PaginatorRouter
+
+    def __init__(self, item: Button, *, key: str, action: str) -> None:
+        item.custom_id = self.router.format_custom_id(key, action)
+        super().__init__(item)
+
+        self.key = key
+        self.action = action
+
+    @classmethod
+    async def from_custom_id(cls, interaction: Interaction, item: Button, match: re.Match[str]) -> RoutedButton:
+        return cls(item, key=match['key'], action=match['action'])
+
+    async def callback(self, interaction: Interaction) -> Any:
+        return await self.router.dispatch(interaction, self.key, self.action)
+
+
+class PaginatorRouter(object):
+    """ Routes button clicks for many paginators through a single registered
+    :class:`~discord.ui.DynamicItem`, rather than keeping one live view per paginator.
+
+    Buttons sent by a routed paginator have ``custom_id`` values in the form
+    ``prefix:key:action``, the router only keeps a mapping of keys to paginators
+    which is evicted once a paginator times out or is stopped.
+
+    .. rubric:: Example
+
+    .. code-block:: py
+
+        from discord.ext.paginator import ButtonPaginator, PaginatorRouter
+
+        router = PaginatorRouter()
+        router.setup(bot)
+
+        ## In commands
+        paginator = ButtonPaginator(pages=pages, router=router)
+        await paginator.start(ctx)
+
+    .. note::
+
+        Extra components passed to a routed paginator are sent as is,
+        so they should be persistent or dynamic items themselves.
+
+    When a :class:`SessionStore` is provided, the cursor of every paginator created
+    through a :meth:`factory` is persisted, so clicks can be served after a restart
+    or by another process sharing the store. The cursor is read from the store on every click,
+    so whichever process receives a click continues from the latest page.
+
+    .. code-block:: py
+
+        router = PaginatorRouter(store=SQLiteSessionStore('sessions.db'))
+
+        @router.factory('leaderboard')
+        async def leaderboard(guild_id):
+            return ButtonPaginator(pages=await build_pages(guild_id), router=router)
+
+        ## In commands, arguments must be JSON serializable
+        paginator = await leaderboard(ctx.guild.id)
+        await paginator.start(ctx)
+
+    .. note::
+
+        :class:`SQLiteSessionStore` buffers writes for ``flush_interval`` seconds, about ``1`` by default.
+        Clicks handed between processes within that window may see the previous page,
+        lower ``flush_interval`` when several processes share a database.
+
+    Parameters
+    ----------
+    prefix: :class:`str`
+        Prefix of generated custom ids, must be unique per router
+    store: Optional[:class:`SessionStore`]
+        Store to persist paginator sessions in
+    """
+    def __init__(self, *, prefix: str = 'dpypag', store: Optional[SessionStore] = None) -> None:
+        self.prefix = prefix
+        self.store = store
+
+        self._factories: Dict[str, Callable[..., Any]] = {}
+
+        self._paginators: Dict[str, Paginator] = {}
+        self._timeouts: Dict[str, asyncio.TimerHandle] = {}
+        # Wall clock deadlines, the same value is stored so expiries can tell a refresh elsewhere apart
+        self._expiries: Dict[str, float] = {}
+        # Background saves and expiries, referenced so they are not garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+        template = r'{}:(?P<key>[0-9a-f]+):(?P<action>{})'.format(re.escape(prefix), '|'.join(ACTIONS))
+        self.item_cls = type('RoutedButton', (RoutedButton,), {'router': self}, template=template)
+
+    def __len__(self) -> int:
+        return len(self._paginators)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._paginators
+
+    def setup(self, client: Client) -> None:
+        """ Registers the router's dynamic item with a client
+
+        Parameters
+        ----------
+        client: :class:`~discord.Client`
+            Client or bot to listen for clicks on
+        """
+        client.add_dynamic_items(self.item_cls)
+
+    def format_custom_id(self, key: str, action: str) -> str:
+        return f'{self.prefix}:{key}:{action}'
+
+    def get(self, key: str) -> Optional[Paginator]:
+        """ Returns the paginator registered under ``key`` if any """
+        return self._paginators.get(key)
+
+    def factory(self, name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """ Decorator registering a function which creates a routed paginator,
+        used to rebuild paginators from stored sessions.
+
+        The function can be a coroutine, its arguments are stored with the session
+        so they must be JSON serializable.
+
+        Parameters
+        ----------
+        name: :class:`str`
+            Name to store sessions under, must be the same across processes
+        """
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            self._factories[name] = func
+
+            @wraps(func)
+            async def wrapper(*args: Any) -> Paginator:
+                paginator = await maybe_coroutine(func, *args)
+                paginator._router_factory = (name, list(args))
+                return paginator
+            return wrapper
+        return decorator
+
+    def register(self, paginator: Paginator, *, key: Optional[str] = None) -> str:
+        """ Registers a paginator, returning the key used in its custom ids """
+        key = key or os.urandom(8).hex()
+        self._paginators[key] = paginator
+        paginator._router_key = key
+
+        self.refresh(key)
+        if self.store is not None:
+            self._spawn(self._save(key, paginator))
+        return key
+
+    def _spawn(self, coro: Coroutine[Any, Any, Any]) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            _log.error('Router background task failed', exc_info=task.exception())
+
+    def refresh(self, key: str) -> None:
+        """ Restarts the timeout of the paginator registered under ``key`` """
+        paginator = self._paginators[key]
+
+        handle = self._timeouts.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+        self._expiries.pop(key, None)
+        if paginator.timeout is not None:
+            loop = asyncio.get_running_loop()
+            self._timeouts[key] = loop.call_later(paginator.timeout, self._expire, key)
+            self._expiries[key] = time.time() + paginator.timeout
+
+    def evict(self, key: str) -> Optional[Paginator]:
+        """ Removes the paginator registered under ``key`` """
+        handle = self._timeouts.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+
+        self._expiries.pop(key, None)
+        return self._paginators.pop(key, None)
+
+    def _expire(self, key: str) -> None:
+        self._timeouts.pop(key, None)
+        deadline = self._expiries.pop(key, None)
+        paginator = self.evict(key)
+        if paginator is not None:
+            self._spawn(self._end_expired(key, paginator, deadline))
+
+    async def _end_expired(self, key: str, paginator: Paginator, deadline: Optional[float]) -> None:
+        if self.store is not None:
+            state = await self.store.get(key, fresh=True)
+            expires = state['expires'] if state is not None else None
+            if expires is not None and deadline is not None and expires > deadline:
+                # Refreshed by another process, only drop the local copy
+                return
+            await self.store.delete(key)
+        paginator._record_end('timeout')
+        await paginator.on_end()
+
+    async def _save(self, key: str, paginator: Paginator) -> None:
+        factory = getattr(paginator, '_router_factory', None)
+        if factory is None:
+            return
+
+        await self.store.set(key, {
+            'factory': factory[0],
+            'args': factory[1],
+            'current_page': paginator.current_page,
+            'timeout': paginator.timeout,
+            'expires': self._expiries.get(key),
+        })
+
+    async def _sync(self, key: str, paginator: Paginator) -> Optional[Paginator]:
+        # Another process may have moved or ended the paginator since this one last served it
+        state = await self.store.get(key, fresh=True)
+        if state is None or (state['expires'] is not None and state['expires'] <= time.time()):
+            self.evict(key)
+            paginator._can_traverse = False
+            paginator._record_end('end' if state is None else 'timeout')
+            if state is not None:
+                await self.store.delete(key)
+            return None
+
+        paginator.current_page = state['current_page']
+        return paginator
+
+    async def _load(self, key: str) -> Optional[Paginator]:
+        state = await self.store.get(key, fresh=True)
+        if state is None:
+            return None
+        if state['expires'] is not None and state['expires'] <= time.time():
+            await self.store.delete(key)
+            return None
+
+        try:
+            func = self._factories[state['factory']]
+        except KeyError:
+            return None
+
+        paginator = await maybe_coroutine(func, *state['args'])
+        paginator._router_factory = (state['factory'], state['args'])
+        paginator.current_page = state['current_page']
+        # Sessions saved before timeouts were stored keep the factory's timeout
+        paginator.timeout = state.get('timeout', paginator.timeout)
+
+        self._paginators[key] = paginator
+        paginator._router_key = key
+        return paginator
+
+    def build_view(self, paginator: ButtonPaginator, key: str, *, disabled: bool = False) -> View:
+        """ Builds the components for a routed paginator
+
+        The returned view is already stopped so it is never stored by the client,
+        clicks are handled by the router instead.
+        """
+        view = View(timeout=None)
+
+        templates = [
+            ('start', paginator._start_template),
+            ('back', paginator._back_template),
+            ('stop', paginator._stop_template),
+            ('forward', paginator._forward_template),
+            ('end', paginator._end_template),
+        ]
+        for action, template in templates:
+            if action in ('start', 'end') and not paginator.allow_fast_traverse:
+                continue
+            button = template.build(disabled=True) if disabled else template.build()
+            view.add_item(self.item_cls(button, key=key, action=action))
+
+        if paginator.extras:
+            if paginator._per_page:
+                try:
+                    items = paginator.extras[paginator.current_page]
+                except IndexError:
+                    items = []
+            else:
+                items = paginator.extras
+            for item in items:
+                if item != -1:
+                    view.add_item(item)
+
+        view.stop()
+        return view
+
+    async def dispatch(self, interaction: Interaction, key: str, action: str) -> Any:
+        """ Handles a click on a routed button """
+        paginator = self._paginators.get(key)
+        if self.store is not None:
+            if paginator is None:
+                paginator = await self._load(key)
+            elif getattr(paginator, '_router_factory', None) is not None:
+                paginator = await self._sync(key, paginator)
+
+        if paginator is None:
+            # Paginator timed out or was stopped, drop the stale components
+            return await interaction.response.edit_message(view=None)
+
+        instrumentation = paginator.instrumentation
+        if instrumentation is None:
+            return await self._handle(interaction, paginator, key, action)
+
+        start = time.perf_counter()
+        try:
+            return await self._handle(interaction, paginator, key, action)
+        except HTTPException as error:
+            instrumentation.on_edit_error(paginator, action, error)
+            raise
+        finally:
+            instrumentation.on_interaction(paginator, action, time.perf_counter() - start)
+
+    async def _handle(self, interaction: Interaction, paginator: Paginator, key: str, action: str) -> Any:
+        if action == 'stop':
+            self.evict(key)
+            paginator._can_traverse = False
+            paginator._record_end('stop')
+            if self.store is not None:
+                await self.store.delete(key)
+
+            view = self.build_view(paginator, key, disabled=True)
+            return await interaction.response.edit_message(view=view)
+
+        self.refresh(key)
+        paginator._begin_interaction(interaction)
+        page = await getattr(paginator, 'traverse_' + action)()
+        page['view'] = self.build_view(paginator, key)
+        if self.store is not None:
+            await self._save(key, paginator)
+
+        return await paginator._reply(interaction, page)
@@ -0,0 +1,177 @@
+# Edit scheduling, coalesces bursts of clicks into a single message edit
+from __future__ import annotations
+from discord import Interaction
+
+from typing import Any, Dict, Optional, TYPE_CHECKING
+import asyncio
+import time
+
+if TYPE_CHECKING:
+    from .button_pag import ButtonPaginatorView
+
+
+class RateBucket(object):
+    """ Token bucket allowing ``rate`` operations every ``per`` seconds """
+    def __init__(self, rate: int, per: float) -> None:
+        self.rate = rate
+        self.per = per
+
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+        self._updated = now
+
+    def idle(self) -> bool:
+        """ Whether the bucket is full with no one waiting, it can then be dropped and recreated freely """
+        self._refill()
+        return self._tokens >= self.rate and not self._lock.locked()
+
+    async def acquire(self) -> None:
+        """ Waits until an operation is allowed """
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class _PendingEdit(object):
+    __slots__ = ('interaction', 'base', 'offset', 'task')
+
+    def __init__(self, interaction: Interaction) -> None:
+        self.interaction = interaction
+        self.base: Optional[str] = None
+        self.offset = 0
+        self.task: Optional[asyncio.Task[None]] = None
+
+
+class EditScheduler(object):
+    """ Coalesces rapid navigation clicks into as few message edits as possible
+
+    Clicks are acknowledged straight away, navigation received within ``delay`` seconds
+    is merged into a net page offset and only the final page is sent.
+    Edits are also limited per channel to stay within Discord's rate limits.
+
+    One scheduler can be shared by every paginator.
+
+    .. rubric:: Example
+
+    .. code-block:: py
+
+        from discord.ext.paginator import ButtonPaginator, EditScheduler
+
+        scheduler = EditScheduler()
+
+        ## In commands
+        paginator = ButtonPaginator(pages=pages, scheduler=scheduler)
+
+    Parameters
+    ----------
+    delay: :class:`float`
+        Seconds to wait for more clicks before editing, defaults to ``0.25``
+    rate: :class:`int`
+        Edits allowed per channel every ``per`` seconds, defaults to ``5``
+    per: :class:`float`
+        Length of the rate limit window in seconds, defaults to ``5``
+    """
+    def __init__(self, *, delay: float = 0.25, rate: int = 5, per: float = 5) -> None:
+        self.delay = delay
+        self.rate = rate
+        self.per = per
+
+        self._pending: Dict[ButtonPaginatorView, _PendingEdit] = {}
+        self._buckets: Dict[Any, RateBucket] = {}
+        # Idle buckets are swept once this many exist, keeping one bucket per channel bounded
+        self._sweep_at = 64
+
+    def _get_bucket(self, interaction: Interaction) -> RateBucket:
+        key = interaction.channel_id
+        try:
+            return self._buckets[key]
+        except KeyError:
+            pass
+
+        if len(self._buckets) >= self._sweep_at:
+            self._buckets = {k: bucket for k, bucket in self._buckets.items() if not bucket.idle()}
+            self._sweep_at = max(64, 2 * len(self._buckets))
+
+        bucket = self._buckets[key] = RateBucket(self.rate, self.per)
+        return bucket
+
+    async def submit(self, interaction: Interaction, view: ButtonPaginatorView, action: str, *, steps: int = 1) -> None:
+        """ Queues a navigation click
+
+        Parameters
+        ----------
+        interaction: :class:`Interaction`
+            Interaction of the click, acknowledged immediately
+        view: :class:`ButtonPaginatorView`
+            View which was clicked
+        action: :class:`str`
+            One of ``start``, ``back``, ``forward`` or ``end``
+        steps: :class:`int`
+            Pages moved by ``back`` and ``forward``, defaults to ``1``
+        """
+        await interaction.response.defer()
+
+        pending = self._pending.get(view)
+        if pending is None:
+            pending = self._pending[view] = _PendingEdit(interaction)
+        pending.interaction = interaction
+
+        if action in ('start', 'end'):
+            pending.base = action
+            pending.offset = 0
+        elif action == 'forward':
+            pending.offset += steps
+        elif action == 'back':
+            pending.offset -= steps
+        else:
+            raise ValueError(f'Unknown action {action!r}')
+
+        if pending.task is None:
+            pending.task = asyncio.get_running_loop().create_task(self._run(view, pending))
+
+    def cancel(self, view: ButtonPaginatorView) -> None:
+        """ Drops pending navigation for a view, e.g. once it is stopped """
+        pending = self._pending.pop(view, None)
+        if pending is not None and pending.task is not None:
+            pending.task.cancel()
+
+    async def _run(self, view: ButtonPaginatorView, pending: _PendingEdit) -> None:
+        paginator = view._paginator
+        try:
+            while pending.base is not None or pending.offset:
+                await asyncio.sleep(self.delay)
+
+                base, offset = pending.base, pending.offset
+                pending.base, pending.offset = None, 0
+
+                if base == 'start':
+                    page = await paginator.traverse_start()
+                elif base == 'end':
+                    page = await paginator.traverse_end()
+                if offset or base is None:
+                    page = await paginator.traverse_by(offset)
+
+                if view._update_extras() or not paginator.edit:
+                    page['view'] = view
+
+                await self._get_bucket(pending.interaction).acquire()
+                await paginator._reply(pending.interaction, page)
+        except ValueError:
+            # Pagination ended while edits were pending
+            pass
+        finally:
+            if self._pending.get(view) is pending:
+                del self._pending[view]
+
+            key = pending.interaction.channel_id
+            bucket = self._buckets.get(key)
+            if bucket is not None and bucket.idle():
+                del self._buckets[key]
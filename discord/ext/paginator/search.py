@@ -0,0 +1,159 @@
+# Full text search over paginator pages
+from __future__ import annotations
+from .source import PageSource
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+import asyncio
+import re
+
+_WORD = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """ Splits text into lowercase words """
+    return _WORD.findall(text.lower())
+
+
+def page_text(page: Mapping[str, Any]) -> Iterator[str]:
+    """ Yields the searchable text of a page, its content and embed text """
+    if page.get('content'):
+        yield str(page['content'])
+
+    embeds = list(page.get('embeds') or ())
+    if page.get('embed') is not None:
+        embeds.append(page['embed'])
+
+    for embed in embeds:
+        if embed is None:
+            continue
+        for text in (embed.title, embed.description, embed.footer.text, embed.author.name):
+            if text:
+                yield text
+        for field in embed.fields:
+            yield field.name or ''
+            yield field.value or ''
+
+
+class SearchIndex(object):
+    """ Inverted index over the pages of a :class:`PageSource`
+
+    The index is built incrementally, pages are only indexed as far as needed
+    to find the next match, ``batch_size`` pages at a time.
+
+    Parameters
+    ----------
+    source: :class:`PageSource`
+        Source to index pages from
+    batch_size: :class:`int`
+        Pages indexed before yielding to the event loop, defaults to ``50``
+    """
+    def __init__(self, source: PageSource, *, batch_size: int = 50) -> None:
+        self.source = source
+        self.batch_size = batch_size
+
+        self._postings: Dict[str, List[int]] = {}
+        self._indexed = 0
+        self._complete = False
+        # Searches running at once must not index the same pages twice
+        self._lock = asyncio.Lock()
+
+    @property
+    def indexed(self) -> int:
+        """ Amount of pages indexed so far """
+        return self._indexed
+
+    @property
+    def complete(self) -> bool:
+        """ Whether every page has been indexed """
+        return self._complete
+
+    async def _fetch(self, index: int) -> Optional[Mapping[str, Any]]:
+        max_page = self.source.max_page
+        if max_page is not None and index > max_page:
+            return None
+
+        try:
+            # Read past the cache so indexing does not evict recently viewed pages
+            if self.source.is_cached(index):
+                return await self.source.get_page(index)
+            return await self.source._read(index)
+        except IndexError:
+            return None
+
+    async def _index_batch(self) -> None:
+        async with self._lock:
+            for _ in range(self.batch_size):
+                if self._complete:
+                    return
+                page = await self._fetch(self._indexed)
+                if page is None:
+                    self._complete = True
+                    return
+
+                words = set()
+                for text in page_text(page):
+                    words.update(tokenize(text))
+                for word in words:
+                    self._postings.setdefault(word, []).append(self._indexed)
+                self._indexed += 1
+
+        # Let other interactions run between batches
+        await asyncio.sleep(0)
+
+    async def build(self) -> None:
+        """ Indexes every remaining page """
+        while not self._complete:
+            await self._index_batch()
+
+    def _match(self, words: List[str], start: int) -> Optional[int]:
+        postings = [self._postings.get(word) for word in words]
+        if not all(postings):
+            return None
+        postings.sort(key=len)
+
+        rarest = postings[0]
+        for position in range(bisect_left(rarest, start), len(rarest)):
+            page = rarest[position]
+            for other in postings[1:]:
+                i = bisect_left(other, page)
+                if i == len(other) or other[i] != page:
+                    break
+            else:
+                return page
+        return None
+
+    async def search(self, query: str, *, start: int = 0, wrap: bool = True) -> Optional[int]:
+        """ Returns the first page at or after ``start`` containing every word in ``query``
+
+        Parameters
+        ----------
+        query: :class:`str`
+            Words to search for
+        start: :class:`int`
+            Index of page to start searching from
+        wrap: :class:`bool`
+            Whether to continue from the first page if nothing matches after ``start``
+        """
+        words = tokenize(query)
+        if not words:
+            return None
+
+        lowest = start
+        while True:
+            match = self._match(words, lowest)
+            if match is not None or self._complete:
+                break
+            # Pages indexed so far had no match, only check new ones
+            lowest = max(lowest, self._indexed)
+            await self._index_batch()
+
+        if match is None and wrap and start > 0:
+            match = self._match(words, 0)
+        return match
+
+    def invalidate(self) -> None:
+        """ Discards the index, call after pages change """
+        self._postings.clear()
+        self._indexed = 0
+        self._complete = False
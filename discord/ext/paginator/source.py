@@ -0,0 +1,312 @@
+# Page sources, used by paginators for fetching pages on demand
+from __future__ import annotations
+from discord.utils import maybe_coroutine
+
+from collections import OrderedDict
+from concurrent.futures import Executor
+from types import MappingProxyType
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Mapping, Optional, Type, Union, TYPE_CHECKING
+import asyncio
+
+if TYPE_CHECKING:
+    from .paginator import Paginator
+
+
+class PageSource(object):
+    """ Base class for providing pages to a :class:`Paginator` on demand
+
+    Subclasses implement :meth:`fetch_page` and optionally :meth:`count`,
+    both of which may be regular functions or coroutines.
+    Fetched pages are kept in a bounded LRU cache.
+
+    .. rubric:: Example
+
+    .. code-block:: py
+
+        from discord.ext.paginator import PageSource
+
+        class LeaderboardSource(PageSource):
+            async def fetch_page(self, index):
+                rows = await db.fetch_rows(offset=index * 10, limit=10)
+                return {'content': '\\n'.join(map(str, rows))}
+
+            async def count(self):
+                return (await db.count_rows() - 1) // 10 + 1
+
+    Parameters
+    ----------
+    max_page: Optional[:class:`int`]
+        Index of the last page if known upfront,
+        otherwise computed lazily using :meth:`count`.
+    cache_size: Optional[:class:`int`]
+        Maximum amount of pages to cache, defaults to ``128``.
+        Set to ``None`` for an unbounded cache or ``0`` to disable caching.
+    executor: Optional[:class:`concurrent.futures.Executor`]
+        Executor to run a regular :meth:`fetch_page` in, keeping slow pages such as charts
+        from blocking the event loop. With a process pool the source is pickled
+        for every page, so it should only hold what :meth:`fetch_page` needs.
+    """
+    def __init__(
+        self, *,
+        max_page: Optional[int] = None,
+        cache_size: Optional[int] = 128,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self.cache_size = cache_size
+        self.executor = executor
+        self._max_page = max_page
+
+        self._cache: OrderedDict[int, Dict[str, Any]] = OrderedDict()
+        # Fetches in progress, shared so a click and a prefetch of the same page only fetch it once
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._generation = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Only the state fetch_page needs is sent to worker processes
+        state = self.__dict__.copy()
+        state.update(_cache=OrderedDict(), _pending={}, executor=None)
+        return state
+
+    @property
+    def max_page(self) -> Optional[int]:
+        """ Index of the last page, ``None`` if not yet computed """
+        return self._max_page
+
+    def fetch_page(self, index: int) -> Dict[str, Any]:
+        """ Produces the page at ``index``, can be a coroutine.
+
+        Should raise :class:`IndexError` if the page does not exist.
+        """
+        raise NotImplementedError
+
+    def count(self) -> int:
+        """ Returns the total number of pages, can be a coroutine.
+
+        Only called when ``max_page`` was not provided.
+        """
+        raise NotImplementedError
+
+    def is_cached(self, index: int) -> bool:
+        """ Whether the page at ``index`` is currently cached """
+        return index in self._cache
+
+    def invalidate(self, index: Optional[int] = None) -> None:
+        """ Removes a page from the cache, or clears the whole cache if no index is provided """
+        # Pages still being fetched were produced from outdated data, do not cache them
+        self._generation += 1
+        if index is None:
+            self._cache.clear()
+            self._pending.clear()
+        else:
+            self._cache.pop(index, None)
+            self._pending.pop(index, None)
+
+    async def get_max_page(self) -> int:
+        """ Returns :attr:`max_page`, computing it if it is not yet known """
+        if self._max_page is None:
+            self._max_page = (await maybe_coroutine(self.count)) - 1
+        return self._max_page
+
+    async def is_last(self, index: int) -> bool:
+        """ Whether ``index`` is the last available page """
+        return index >= await self.get_max_page()
+
+    async def get_page(self, index: int) -> Dict[str, Any]:
+        """ Returns the page at ``index``, using the cache where possible """
+        try:
+            page = self._cache[index]
+        except KeyError:
+            pass
+        else:
+            self._cache.move_to_end(index)
+            return page
+
+        if self.executor is None and not asyncio.iscoroutinefunction(self.fetch_page):
+            return self._store(index, self.fetch_page(index), self._generation)
+
+        pending = self._pending.get(index)
+        if pending is None:
+            pending = self._pending[index] = asyncio.ensure_future(self._fetch(index))
+            pending.add_done_callback(lambda future: self._pending.get(index) is future and self._pending.pop(index))
+        # Shielded so a cancelled prefetch does not cancel the fetch for other waiters
+        return await asyncio.shield(pending)
+
+    async def _read(self, index: int) -> Dict[str, Any]:
+        # Fetches a page without caching it, on the executor if one is set
+        if self.executor is not None and not asyncio.iscoroutinefunction(self.fetch_page):
+            return await asyncio.get_running_loop().run_in_executor(self.executor, self.fetch_page, index)
+        return await maybe_coroutine(self.fetch_page, index)
+
+    async def _fetch(self, index: int) -> Dict[str, Any]:
+        generation = self._generation
+        page = await self._read(index)
+        return self._store(index, page, generation)
+
+    def _store(self, index: int, page: Dict[str, Any], generation: int) -> Dict[str, Any]:
+        if self.cache_size != 0 and generation == self._generation:
+            self._cache[index] = page
+            if self.cache_size is not None and len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return page
+
+
+class ListPageSource(PageSource):
+    """ Page source backed by a list of pages,
+    this is the default source used when a list is passed to :class:`Paginator`
+
+    Parameters
+    ----------
+    pages: List[Dict[:class:`str`, Any]]
+        An array of pages
+    """
+    def __init__(self, pages: List[Dict[str, Any]]) -> None:
+        super().__init__(cache_size=0)
+        self.pages = pages
+
+    @property
+    def max_page(self) -> int:
+        return len(self.pages) - 1
+
+    def fetch_page(self, index: int) -> Dict[str, Any]:
+        return self.pages[index]
+
+    async def get_max_page(self) -> int:
+        return len(self.pages) - 1
+
+    async def get_page(self, index: int) -> Dict[str, Any]:
+        return self.pages[index]
+
+
+class PageSet(PageSource):
+    """ Immutable set of pages which can be shared between many paginators,
+    each paginator only keeps its own cursor so concurrent users do not affect each other.
+
+    .. rubric:: Example
+
+    .. code-block:: py
+
+        from discord.ext.paginator import ButtonPaginator, PageSet
+
+        HELP_PAGES = PageSet([{'content': 'Page 1'}, {'content': 'Page 2'}])
+
+        ## In commands
+        await HELP_PAGES.session(ButtonPaginator).start(ctx)
+
+    .. note::
+
+        Extras passed to :class:`ButtonPaginator` are components bound to a single view,
+        create them per session rather than sharing them.
+
+    Parameters
+    ----------
+    pages: Iterable[Mapping[:class:`str`, Any]]
+        Pages to freeze, each page is copied
+    """
+    def __init__(self, pages: Iterable[Mapping[str, Any]]) -> None:
+        super().__init__(cache_size=0)
+
+        self._pages = tuple(
+            MappingProxyType({k: tuple(v) if isinstance(v, list) else v for k, v in page.items()})
+            for page in pages
+        )
+        self._max_page = len(self._pages) - 1
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def __getitem__(self, index: int) -> Mapping[str, Any]:
+        return self._pages[index]
+
+    def fetch_page(self, index: int) -> Mapping[str, Any]:
+        return self._pages[index]
+
+    async def get_max_page(self) -> int:
+        return self._max_page
+
+    async def get_page(self, index: int) -> Mapping[str, Any]:
+        return self._pages[index]
+
+    def session(self, cls: Type[Paginator], **paginator_kwds: Any) -> Paginator:
+        """ Creates a paginator reading from this page set
+
+        Parameters
+        ----------
+        cls: Type[:class:`Paginator`]
+            Paginator class to create, e.g. :class:`ButtonPaginator`
+        paginator_kwds: Any
+            Keyword arguments to pass to the paginator
+        """
+        return cls(pages=self, **paginator_kwds)
+
+
+class IteratorPageSource(PageSource):
+    """ Page source which lazily consumes an iterator or async iterator of pages,
+    pages are only pulled from the iterator once they are first visited.
+
+    .. note::
+
+        Consumed pages are kept so they can be revisited,
+        traversing to the end or computing :attr:`max_page` consumes the whole iterator.
+
+    Parameters
+    ----------
+    pages: Union[Iterable[Dict[:class:`str`, Any]], AsyncIterable[Dict[:class:`str`, Any]]]
+        Iterable of pages
+    """
+    def __init__(self, pages: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]) -> None:
+        super().__init__(cache_size=0)
+
+        if hasattr(pages, '__aiter__'):
+            self._iterator: Union[Iterator[Dict[str, Any]], AsyncIterator[Dict[str, Any]]] = pages.__aiter__()
+        else:
+            self._iterator = iter(pages)
+        self._pages: List[Dict[str, Any]] = []
+        # Only one read may advance the iterator at a time
+        self._lock = asyncio.Lock()
+
+    async def _next(self) -> bool:
+        if self._iterator is None:
+            return False
+
+        try:
+            if hasattr(self._iterator, '__anext__'):
+                page = await self._iterator.__anext__()
+            else:
+                page = next(self._iterator)
+        except (StopIteration, StopAsyncIteration):
+            self._iterator = None
+            self._max_page = len(self._pages) - 1
+            return False
+
+        self._pages.append(page)
+        return True
+
+    def is_cached(self, index: int) -> bool:
+        return index < len(self._pages)
+
+    async def count(self) -> int:
+        async with self._lock:
+            while await self._next():
+                pass
+        return len(self._pages)
+
+    async def fetch_page(self, index: int) -> Dict[str, Any]:
+        if index >= len(self._pages):
+            async with self._lock:
+                # Pages may have been read while waiting for the lock
+                while index >= len(self._pages):
+                    if not await self._next():
+                        raise IndexError('page index out of range')
+        return self._pages[index]
+
+    async def is_last(self, index: int) -> bool:
+        if self._max_page is not None:
+            return index >= self._max_page
+        try:
+            await self.fetch_page(index + 1)
+        except IndexError:
+            return True
+        return False
+
+    async def get_page(self, index: int) -> Dict[str, Any]:
+        return await self.fetch_page(index)
@@ -0,0 +1,215 @@
+# Session stores, used for persisting paginator state outside of the process
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set, Tuple
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+
+_log = logging.getLogger(__name__)
+
+
+class SessionStore(object):
+    """ Base class for storing paginator sessions,
+    a session is a small JSON serializable dictionary describing a paginator's cursor.
+
+    Used by :class:`PaginatorRouter` so paginators survive restarts
+    and can be served by any process sharing the store.
+    """
+    async def get(self, key: str, *, fresh: bool = False) -> Optional[Dict[str, Any]]:
+        """ Returns the session stored under ``key``, ``None`` if missing
+
+        Parameters
+        ----------
+        key: :class:`str`
+            Key of the session
+        fresh: :class:`bool`
+            Whether to bypass any read cache, so sessions written by other processes are seen
+        """
+        raise NotImplementedError
+
+    async def set(self, key: str, state: Dict[str, Any]) -> None:
+        """ Stores a session under ``key`` """
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        """ Removes the session stored under ``key`` """
+        raise NotImplementedError
+
+    async def flush(self) -> None:
+        """ Writes any pending changes """
+
+    async def close(self) -> None:
+        """ Flushes pending changes and releases resources """
+        await self.flush()
+
+
+class MemorySessionStore(SessionStore):
+    """ Session store which keeps sessions in a dictionary,
+    sessions do not outlive the process.
+    """
+    def __init__(self) -> None:
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+
+    async def get(self, key: str, *, fresh: bool = False) -> Optional[Dict[str, Any]]:
+        return self._sessions.get(key)
+
+    async def set(self, key: str, state: Dict[str, Any]) -> None:
+        self._sessions[key] = state
+
+    async def delete(self, key: str) -> None:
+        self._sessions.pop(key, None)
+
+
+class SQLiteSessionStore(SessionStore):
+    """ Session store backed by a local SQLite database
+
+    Writes are buffered and flushed in batches, either once ``batch_size``
+    writes are pending or ``flush_interval`` seconds after the first pending write.
+    Reads go through an LRU cache before touching the database,
+    :class:`PaginatorRouter` bypasses it so sessions written by other processes are always seen.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        Path of the database file
+    flush_interval: :class:`float`
+        Seconds to wait before flushing pending writes, defaults to ``1``
+    batch_size: :class:`int`
+        Amount of pending writes which forces a flush, defaults to ``100``
+    cache_size: :class:`int`
+        Maximum amount of sessions to cache, defaults to ``1024``
+    cache_ttl: Optional[:class:`float`]
+        Seconds a cached session is trusted for, ``None`` to trust it until evicted
+    """
+    def __init__(
+        self, path: str, *,
+        flush_interval: float = 1,
+        batch_size: int = 100,
+        cache_size: int = 1024,
+        cache_ttl: Optional[float] = None,
+    ) -> None:
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+
+        # A single worker thread serialises every access to the connection
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dpy-paginator-sqlite')
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self._cache: OrderedDict[str, Tuple[float, Optional[Dict[str, Any]]]] = OrderedDict()
+        self._pending: Dict[str, Optional[str]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_lock = asyncio.Lock()
+        # Background flushes, referenced so they are not garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS paginator_sessions '
+                '(key TEXT PRIMARY KEY, state TEXT NOT NULL, updated REAL NOT NULL)'
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _select(self, key: str) -> Optional[str]:
+        row = self._connect().execute('SELECT state FROM paginator_sessions WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _write(self, pending: Dict[str, Optional[str]]) -> None:
+        conn = self._connect()
+        now = time.time()
+
+        with conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO paginator_sessions (key, state, updated) VALUES (?, ?, ?)',
+                [(k, v, now) for k, v in pending.items() if v is not None]
+            )
+            conn.executemany(
+                'DELETE FROM paginator_sessions WHERE key = ?',
+                [(k,) for k, v in pending.items() if v is None]
+            )
+
+    async def _run(self, func, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _cache_put(self, key: str, state: Optional[Dict[str, Any]]) -> None:
+        self._cache[key] = (time.monotonic(), state)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _spawn_flush(self) -> None:
+        task = asyncio.get_running_loop().create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._flush_done)
+
+    def _flush_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            _log.error('Failed to flush paginator sessions', exc_info=task.exception())
+
+    def _schedule_flush(self) -> None:
+        if len(self._pending) >= self.batch_size:
+            self._spawn_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.flush_interval, self._spawn_flush)
+
+    async def get(self, key: str, *, fresh: bool = False) -> Optional[Dict[str, Any]]:
+        try:
+            cached_at, state = self._cache[key]
+        except KeyError:
+            pass
+        else:
+            if not fresh and (self.cache_ttl is None or time.monotonic() - cached_at < self.cache_ttl):
+                self._cache.move_to_end(key)
+                return state
+
+        # Writes not yet flushed are the latest state other processes could have seen
+        if key in self._pending:
+            raw = self._pending[key]
+        else:
+            raw = await self._run(self._select, key)
+
+        state = json.loads(raw) if raw is not None else None
+        self._cache_put(key, state)
+        return state
+
+    async def set(self, key: str, state: Dict[str, Any]) -> None:
+        self._cache_put(key, state)
+        self._pending[key] = json.dumps(state, separators=(',', ':'))
+        self._schedule_flush()
+
+    async def delete(self, key: str) -> None:
+        self._cache_put(key, None)
+        self._pending[key] = None
+        self._schedule_flush()
+
+    async def flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            await self._run(self._write, pending)
+
+    async def close(self) -> None:
+        await self.flush()
+
+        if self._conn is not None:
+            await self._run(self._conn.close)
+            self._conn = None
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,211 @@
+# Paginating columnar data as fixed-width tables
+from __future__ import annotations
+from discord import Embed
+
+from .source import PageSource
+from .text import EMBED_DESCRIPTION_LIMIT, MESSAGE_LIMIT
+from .button_pag import ButtonPaginator
+
+from numbers import Integral, Real
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Format types where the widest value is always the smallest or largest one
+_MONOTONIC_TYPES = frozenset('dfF%')
+
+
+def _default_format(values: Sequence[Any]) -> Optional[str]:
+    """ Returns the number format for a column, ``None`` for text columns """
+    if np is not None and isinstance(values, np.ndarray):
+        if values.dtype.kind in 'iu':
+            return 'd'
+        if values.dtype.kind == 'f':
+            return '.2f'
+        return None
+
+    kind = 'd'
+    for value in values:
+        if isinstance(value, bool) or not isinstance(value, Real):
+            return None
+        if not isinstance(value, Integral):
+            kind = '.2f'
+    return kind if len(values) else None
+
+
+def _number_width(values: Sequence[Any], fmt: str) -> int:
+    if not len(values):
+        return 0
+    if fmt[-1:] not in _MONOTONIC_TYPES and not fmt.endswith(','):
+        return max(len(format(value, fmt)) for value in values)
+
+    # Only the extremes need formatting, no string is built per value
+    if np is not None:
+        array = np.asarray(values)
+        finite = array[np.isfinite(array)] if array.dtype.kind == 'f' else array
+        extremes = (finite.min(), finite.max()) if finite.size else ()
+        missing = finite.size < array.size
+    else:
+        finite = [value for value in values if value == value and abs(value) != float('inf')]
+        extremes = (min(finite), max(finite)) if finite else ()
+        missing = len(finite) < len(values)
+
+    widths = [len(format(value, fmt)) for value in extremes]
+    if missing:
+        # nan, inf and -inf are no wider than -inf
+        widths.append(len(format(float('-inf'), fmt)))
+    return max(widths)
+
+
+def _text_width(values: Sequence[Any]) -> int:
+    if not len(values):
+        return 0
+    if np is not None and isinstance(values, np.ndarray) and values.dtype.kind == 'U':
+        return int(np.char.str_len(values).max())
+    return max(len(str(value)) for value in values)
+
+
+class TablePageSource(PageSource):
+    """ Page source rendering columnar data as a fixed-width table in a code block
+
+    Column widths and number formats are computed once upfront,
+    only the rows of a page are formatted when it is visited.
+    NumPy arrays are used for computing widths if NumPy is installed.
+
+    Parameters
+    ----------
+    columns: Mapping[:class:`str`, Sequence[Any]]
+        Column headers mapped to their values, every column must have the same length.
+        Values can be sequences or NumPy arrays.
+    formats: Mapping[:class:`str`, :class:`str`]
+        Format specs for columns by header, e.g. ``{'price': ',.2f'}``.
+        Integer columns default to ``d``, other number columns to ``.2f``.
+    per_page: Optional[:class:`int`]
+        Rows per page, defaults to as many as fit
+    max_column_width: :class:`int`
+        Width text columns are truncated to, defaults to ``40``
+    embed: Optional[:class:`Embed`]
+        Embed to use as a template, the table is placed in the description of a copy of it.
+        If not provided the table is sent as message content.
+    cache_size: Optional[:class:`int`]
+        Maximum amount of pages to cache, see :class:`PageSource`
+    """
+    def __init__(
+        self, columns: Mapping[str, Sequence[Any]], *,
+        formats: Mapping[str, str] = {},
+        per_page: Optional[int] = None,
+        max_column_width: int = 40,
+        embed: Optional[Embed] = None,
+        cache_size: Optional[int] = 128,
+    ) -> None:
+        self.headers = [str(header) for header in columns.keys()]
+        self.columns = list(columns.values())
+        if np is not None:
+            # Widths and number formats are then found using vectorized operations
+            self.columns = [np.asarray(column) for column in self.columns]
+        self.embed = embed
+
+        lengths = {len(column) for column in self.columns}
+        if len(lengths) > 1:
+            raise ValueError('columns must all have the same length')
+        self.rows = lengths.pop() if lengths else 0
+
+        cells, widths = [], []
+        for header, values in zip(self.headers, self.columns):
+            fmt = formats.get(header, _default_format(values))
+            if fmt is None:
+                width = min(max(_text_width(values), len(header)), max_column_width)
+                cells.append(f'{{!s:<{width}.{width}}}')
+            else:
+                width = max(_number_width(values, fmt), len(header))
+                cells.append(f'{{:>{width}{fmt}}}')
+            widths.append(width)
+
+        self._row_format = '  '.join(cells)
+        self._header = '  '.join(header[:width].ljust(width) for header, width in zip(self.headers, widths))
+        self._rule = '  '.join('-' * width for width in widths)
+
+        line = len(self._header) + 1
+        limit = EMBED_DESCRIPTION_LIMIT if embed is not None else MESSAGE_LIMIT
+        limit -= sum(map(len, self._frame(self.rows, self.rows)))
+        fits = (limit - 2 * line) // line
+        if fits < 1:
+            raise ValueError('table rows are too wide to fit on a page')
+        self.per_page = min(per_page, fits) if per_page is not None else fits
+
+        super().__init__(max_page=max(0, (self.rows - 1) // self.per_page), cache_size=cache_size)
+
+    def _frame(self, start: int, end: int) -> Tuple[str, str]:
+        return ('```\n', f'\n```\nRows {start}-{end} of {self.rows}')
+
+    def _rows(self, start: int, end: int) -> List[str]:
+        row_format = self._row_format.format
+        columns = [column[start:end] for column in self.columns]
+        return [row_format(*values).rstrip() for values in zip(*columns)]
+
+    def fetch_page(self, index: int) -> Dict[str, Any]:
+        if index < 0 or index > self.max_page:
+            raise IndexError('page index out of range')
+
+        start = index * self.per_page
+        end = min(start + self.per_page, self.rows)
+        prefix, suffix = self._frame(start + 1 if self.rows else 0, end)
+        text = prefix + '\n'.join([self._header.rstrip(), self._rule, *self._rows(start, end)]) + suffix
+
+        if self.embed is None:
+            return {'content': text}
+
+        embed = self.embed.copy()
+        embed.description = text
+        return {'embeds': [embed]}
+
+
+class TablePaginator(ButtonPaginator):
+    """ Button paginator for columnar data, see :class:`TablePageSource`
+
+    .. rubric:: Example
+
+    .. code-block:: py
+
+        from discord.ext.paginator import TablePaginator
+
+        paginator = TablePaginator({
+            'user': names,
+            'messages': message_counts,
+            'score': np.array(scores),
+        }, formats={'score': '.1%'})
+        await paginator.start(ctx)
+
+    .. note::
+
+        All parameters apart from ``pages``, ``embeds`` and ``messages``
+        from :class:`ButtonPaginator` are valid.
+
+    Parameters
+    ----------
+    columns: Mapping[:class:`str`, Sequence[Any]]
+        Column headers mapped to their values
+    formats: Mapping[:class:`str`, :class:`str`]
+        Format specs for columns by header
+    per_page: Optional[:class:`int`]
+        Rows per page, defaults to as many as fit
+    max_column_width: :class:`int`
+        Width text columns are truncated to, defaults to ``40``
+    embed: Optional[:class:`Embed`]
+        Embed to place the table in the description of
+    """
+    def __init__(
+        self, columns: Mapping[str, Sequence[Any]], *,
+        formats: Mapping[str, str] = {},
+        per_page: Optional[int] = None,
+        max_column_width: int = 40,
+        embed: Optional[Embed] = None,
+        **paginator_kwds: Any
+    ) -> None:
+        paginator_kwds['pages'] = TablePageSource(
+            columns, formats=formats, per_page=per_page, max_column_width=max_column_width, embed=embed
+        )
+        super().__init__(**paginator_kwds)
@@ -0,0 +1,164 @@
+# Utilities for splitting large text into pages
+from __future__ import annotations
+from discord import Embed
+
+from .source import IteratorPageSource
+
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
+
+
+MESSAGE_LIMIT = 2000
+EMBED_DESCRIPTION_LIMIT = 4096
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    """ Yields the lines of ``text`` without building a list of them """
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end == -1:
+            if start < len(text):
+                yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+class TextSplitter(object):
+    """ Incrementally splits lines into chunks no longer than ``max_size``
+
+    Lines are kept whole where possible, lines which are too long
+    are split at word boundaries, or at ``max_size`` if they contain no spaces.
+
+    Parameters
+    ----------
+    max_size: :class:`int`
+        Maximum size of a chunk including ``prefix`` and ``suffix``
+    prefix: :class:`str`
+        Text to start every chunk with, e.g. ``'```py\\n'``
+    suffix: :class:`str`
+        Text to end every chunk with, e.g. ``'\\n```'``
+    """
+    def __init__(self, max_size: int = MESSAGE_LIMIT, *, prefix: str = '', suffix: str = '') -> None:
+        self.max_size = max_size - len(prefix) - len(suffix)
+        self.prefix = prefix
+        self.suffix = suffix
+
+        if self.max_size <= 0:
+            raise ValueError('prefix and suffix do not fit within max_size')
+
+        self._parts: List[str] = []
+        self._size = 0
+
+    def _flush(self) -> str:
+        chunk = self.prefix + '\n'.join(self._parts) + self.suffix
+        self._parts.clear()
+        self._size = 0
+        return chunk
+
+    def _split_line(self, line: str) -> Iterator[str]:
+        while len(line) > self.max_size:
+            cut = line.rfind(' ', 0, self.max_size + 1)
+            if cut <= 0:
+                cut = self.max_size
+            yield line[:cut]
+            line = line[cut:].lstrip(' ')
+        yield line
+
+    def feed(self, line: str) -> List[str]:
+        """ Adds a line, returning any chunks which were completed """
+        chunks = []
+        for part in self._split_line(line.rstrip('\r\n')):
+            # Joining newline is only needed once a line is already present
+            size = self._size + len(part) + (1 if self._parts else 0)
+            if size > self.max_size and self._parts:
+                chunks.append(self._flush())
+                size = len(part)
+            self._parts.append(part)
+            self._size = size
+        return chunks
+
+    def finish(self) -> Optional[str]:
+        """ Returns the remaining partial chunk, if any """
+        if not self._parts:
+            return None
+        return self._flush()
+
+
+def split_lines(lines: Iterable[str], **splitter_kwds: Any) -> Iterator[str]:
+    """ Lazily splits an iterable of lines into chunks,
+    keyword arguments are passed to :class:`TextSplitter`
+    """
+    splitter = TextSplitter(**splitter_kwds)
+    for line in lines:
+        yield from splitter.feed(line)
+
+    last = splitter.finish()
+    if last is not None:
+        yield last
+
+
+async def async_split_lines(lines: AsyncIterable[str], **splitter_kwds: Any) -> AsyncIterator[str]:
+    """ Async version of :func:`split_lines` """
+    splitter = TextSplitter(**splitter_kwds)
+    async for line in lines:
+        for chunk in splitter.feed(line):
+            yield chunk
+
+    last = splitter.finish()
+    if last is not None:
+        yield last
+
+
+class TextPageSource(IteratorPageSource):
+    """ Page source which lazily splits lines of text into pages
+
+    Parameters
+    ----------
+    lines: Union[Iterable[:class:`str`], AsyncIterable[:class:`str`]]
+        Lines of text to paginate, read as pages are visited
+        so they must stay readable until pagination ends
+    embed: Optional[:class:`Embed`]
+        Embed to use as a template, text is placed in the description of a copy of it.
+        If not provided text is sent as message content.
+    prefix: :class:`str`
+        Text to start each page with
+    suffix: :class:`str`
+        Text to end each page with
+    max_size: Optional[:class:`int`]
+        Maximum size of a page, defaults to the content or embed description limit
+    """
+    def __init__(
+        self, lines: Union[Iterable[str], AsyncIterable[str]], *,
+        embed: Optional[Embed] = None,
+        prefix: str = '',
+        suffix: str = '',
+        max_size: Optional[int] = None,
+    ) -> None:
+        if max_size is None:
+            max_size = EMBED_DESCRIPTION_LIMIT if embed is not None else MESSAGE_LIMIT
+        self.embed = embed
+
+        kwds = {'max_size': max_size, 'prefix': prefix, 'suffix': suffix}
+        if hasattr(lines, '__aiter__'):
+            chunks = async_split_lines(lines, **kwds)
+        else:
+            chunks = split_lines(lines, **kwds)
+
+        super().__init__(self._to_pages(chunks))
+
+    def _to_page(self, chunk: str) -> Dict[str, Any]:
+        if self.embed is None:
+            return {'content': chunk}
+
+        embed = self.embed.copy()
+        embed.description = chunk
+        return {'embeds': [embed]}
+
+    def _to_pages(self, chunks):
+        if hasattr(chunks, '__aiter__'):
+            async def pages():
+                async for chunk in chunks:
+                    yield self._to_page(chunk)
+            return pages()
+        return map(self._to_page, chunks)
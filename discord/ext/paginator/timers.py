@@ -0,0 +1,158 @@
+# Hashed timer wheel expiring many paginators from a single task
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
+import asyncio
+import logging
+
+if TYPE_CHECKING:
+    from .paginator import Paginator
+
+_log = logging.getLogger(__name__)
+
+
+class TimerWheel(object):
+    """ Central timeout scheduler shared by many paginators
+
+    Rather than one timer per view, deadlines are kept in a hashed timer wheel
+    advanced by a single task every ``resolution`` seconds. Refreshing a deadline
+    on each interaction is O(1), and paginators expiring on the same tick are ended together,
+    with their components disabled concurrently.
+
+    Timeouts are accurate to within ``resolution`` seconds.
+
+    .. rubric:: Example
+
+    .. code-block:: py
+
+        from discord.ext.paginator import ButtonPaginator, TimerWheel
+
+        timers = TimerWheel()
+
+        ## In commands
+        paginator = ButtonPaginator(pages=pages, timer=timers)
+
+    Parameters
+    ----------
+    resolution: :class:`float`
+        Seconds between ticks, defaults to ``1``
+    slots: :class:`int`
+        Amount of slots in the wheel, defaults to ``512``
+    disable_components: :class:`bool`
+        Whether to disable the components of expired paginators, defaults to ``True``
+    concurrency: :class:`int`
+        Maximum amount of messages edited at once when expiring paginators, defaults to ``10``
+    """
+    def __init__(
+        self, *,
+        resolution: float = 1,
+        slots: int = 512,
+        disable_components: bool = True,
+        concurrency: int = 10,
+    ) -> None:
+        self.resolution = resolution
+        self.disable_components = disable_components
+        self.concurrency = concurrency
+
+        # Slots hold paginators which may expire on their tick, deadlines are the source of truth
+        self._slots: List[Dict[Paginator, None]] = [{} for _ in range(slots)]
+        self._deadlines: Dict[Paginator, float] = {}
+        self._timeouts: Dict[Paginator, float] = {}
+        self._tick = 0
+        self._task: Optional[asyncio.Task] = None
+        # Expiries in progress, referenced so they are not garbage collected
+        self._expiring: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, paginator: Paginator) -> bool:
+        return paginator in self._deadlines
+
+    def _slot(self, deadline: float) -> Dict[Paginator, None]:
+        # Rounded up so a paginator is never seen before its deadline's tick
+        return self._slots[-int(-deadline // self.resolution) % len(self._slots)]
+
+    def schedule(self, paginator: Paginator, timeout: float) -> None:
+        """ Expires ``paginator`` after ``timeout`` seconds without interactions """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        previous = self._deadlines.get(paginator)
+
+        self._timeouts[paginator] = timeout
+        self._deadlines[paginator] = deadline
+        if previous is None or deadline < previous:
+            self._slot(deadline)[paginator] = None
+
+        if self._task is None:
+            self._tick = int(loop.time() // self.resolution)
+            self._task = loop.create_task(self._run())
+
+    def refresh(self, paginator: Paginator) -> None:
+        """ Restarts the timeout of ``paginator``, called on each interaction """
+        timeout = self._timeouts.get(paginator)
+        if timeout is not None:
+            # Only the deadline moves, the paginator is moved to its new slot once its old one is reached
+            self._deadlines[paginator] = asyncio.get_running_loop().time() + timeout
+
+    def cancel(self, paginator: Paginator) -> None:
+        """ Stops tracking ``paginator``, called automatically once it ends """
+        self._timeouts.pop(paginator, None)
+        self._deadlines.pop(paginator, None)
+
+    def _advance(self, now: float) -> List[Paginator]:
+        expired = []
+        tick = int(now // self.resolution)
+        # After a long stall every slot is visited at most once
+        start = max(self._tick + 1, tick - len(self._slots) + 1)
+
+        for current in range(start, tick + 1):
+            index = current % len(self._slots)
+            slot, self._slots[index] = self._slots[index], {}
+
+            for paginator in slot:
+                deadline = self._deadlines.get(paginator)
+                if deadline is None:
+                    continue
+                if deadline <= now:
+                    self.cancel(paginator)
+                    expired.append(paginator)
+                else:
+                    self._slot(deadline)[paginator] = None
+
+        self._tick = tick
+        return expired
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._deadlines:
+                await asyncio.sleep(self.resolution)
+                expired = self._advance(loop.time())
+                if expired:
+                    task = loop.create_task(self._expire_many(expired))
+                    self._expiring.add(task)
+                    task.add_done_callback(self._expiring.discard)
+        finally:
+            self._task = None
+
+    async def _expire_many(self, paginators: List[Paginator]) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def expire(paginator: Paginator) -> None:
+            async with semaphore:
+                await paginator._expire(disable_components=self.disable_components)
+
+        results = await asyncio.gather(*map(expire, paginators), return_exceptions=True)
+        for paginator, result in zip(paginators, results):
+            if isinstance(result, Exception):
+                _log.warning('Failed to expire %r: %r', paginator, result)
+
+    def close(self) -> None:
+        """ Stops the wheel without expiring tracked paginators """
+        if self._task is not None:
+            self._task.cancel()
+        self._deadlines.clear()
+        self._timeouts.clear()
+        for slot in self._slots:
+            slot.clear()